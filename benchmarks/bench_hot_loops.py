@@ -0,0 +1,263 @@
+"""Microbenchmarks for the per-item hot loops inside plugins.
+
+Each case feeds generated but realistic inputs (file paths from a typical
+distro tree, environment keys, crontab lines, `ss -tlnp` rows) through the
+helper a plugin calls once per item, and reports:
+
+  ns/item      best-of-N wall time per item (time.perf_counter_ns)
+  tmp B/item   transient bytes per call: the tracemalloc peak while the helper
+               runs, above what was live before it, with the result discarded
+  kept B/item  bytes still allocated per item while a pass's results are kept;
+               "-" for predicates, whose bool results never allocate
+  peak KiB     tracemalloc peak during one pass, results included
+
+Candidate rewrites are benchmarked next to the current code so an
+optimization can be justified (or rejected) with numbers.
+
+    python benchmarks/bench_hot_loops.py
+    python benchmarks/bench_hot_loops.py --items 200000 --repeat 7 --only high_value
+"""
+import argparse
+import gc
+import json
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+from upsift.plugins.check_crontab_hijack import _script_paths
+from upsift.plugins.check_env_variables import SECRET_PATTERNS, _secret_label
+from upsift.plugins.check_open_ports import _line_ports
+from upsift.plugins.check_world_writable_files import HIGH_VALUE_PATHS, _is_high_value
+
+SEED = 1337
+
+# Items traced one call at a time for tmp B/item; per-call tracing is slow
+TRANSIENT_SAMPLE = 5000
+
+
+# --- input generators -------------------------------------------------------
+
+_TREE = [
+    ("/usr/lib/x86_64-linux-gnu", 0.25), ("/usr/share/doc", 0.15), ("/usr/share/locale", 0.10),
+    ("/home/alice/.cache", 0.10), ("/var/lib/dpkg/info", 0.08), ("/etc", 0.05),
+    ("/usr/bin", 0.05), ("/opt/app/node_modules", 0.10), ("/srv/www", 0.04),
+    ("/var/log", 0.03), ("/lib/modules/6.1.0/kernel", 0.05),
+]
+_EXTS = [".so", ".py", ".conf", ".gz", ".json", ".mo", "", ".js", ".list", ".log"]
+
+
+def gen_paths(n, rng):
+    dirs, weights = zip(*_TREE)
+    paths = []
+    for base in rng.choices(dirs, weights, k=n):
+        depth = rng.randint(0, 3)
+        sub = "/".join(f"d{rng.randint(0, 50)}" for _ in range(depth))
+        name = f"f{rng.randint(0, 10**6)}{rng.choice(_EXTS)}"
+        paths.append(f"{base}/{sub}/{name}" if sub else f"{base}/{name}")
+    return paths
+
+
+_ENV_KEYS = [
+    "PATH", "HOME", "LANG", "SHELL", "USER", "PWD", "OLDPWD", "TERM", "LOGNAME", "EDITOR",
+    "XDG_RUNTIME_DIR", "XDG_SESSION_ID", "SSH_CONNECTION", "SSH_TTY", "MAIL", "LC_ALL",
+    "HISTSIZE", "JAVA_HOME", "GOPATH", "PYTHONPATH", "NODE_ENV", "KUBECONFIG",
+    "AWS_SECRET_ACCESS_KEY", "GITHUB_TOKEN", "DATABASE_URL", "SLACK_WEBHOOK_KEY", "DB_PASSWORD",
+]
+
+
+def gen_env_keys(n, rng):
+    # Mostly benign keys with a CI-runner-sized tail of app settings
+    return [
+        rng.choice(_ENV_KEYS) if rng.random() < 0.7 else f"APP_SETTING_{rng.randint(0, 999)}"
+        for _ in range(n)
+    ]
+
+
+_CRON_TEMPLATES = [
+    "*/5 * * * * root /usr/local/bin/backup-{i}.sh --quiet >/dev/null 2>&1",
+    "17 * * * * root cd / && run-parts --report /etc/cron.hourly",
+    "@daily www-data /usr/bin/php /srv/www/app{i}/artisan schedule:run",
+    "0 3 * * 0 root test -x /usr/sbin/anacron || ( cd / && run-parts --report /etc/cron.weekly )",
+    "30 2 * * * postgres /usr/bin/python3 /opt/jobs/vacuum_{i}.py --all",
+    "MAILTO=ops@example.com",
+    "0 */6 * * * root /usr/bin/certbot renew --quiet",
+]
+
+
+def gen_cron_lines(n, rng):
+    return [rng.choice(_CRON_TEMPLATES).format(i=rng.randint(0, 99)) for _ in range(n)]
+
+
+def gen_ss_lines(n, rng):
+    lines = ["State  Recv-Q Send-Q Local Address:Port  Peer Address:Port Process"]
+    procs = ["sshd", "nginx", "postgres", "redis-server", "node", "containerd"]
+    for i in range(n - 1):
+        addr = rng.choice(["0.0.0.0", "127.0.0.1", "[::]", "*", "10.0.0.5"])
+        port = rng.choice([22, 80, 443, 5432, 6379, 8080, 3000, 4444, rng.randint(1024, 65535)])
+        proc = rng.choice(procs)
+        lines.append(
+            f'LISTEN 0      4096   {addr}:{port}   0.0.0.0:*   '
+            f'users:(("{proc}",pid={1000 + i},fd=3))'
+        )
+    return lines
+
+
+# --- candidate rewrites -------------------------------------------------------
+
+_HIGH_VALUE_TUPLE = tuple(HIGH_VALUE_PATHS)
+
+
+def high_value_tuple(path):
+    return path.startswith(_HIGH_VALUE_TUPLE)
+
+
+def _build_trie(prefixes):
+    root = {}
+    for prefix in prefixes:
+        node = root
+        for part in prefix.strip("/").split("/"):
+            node = node.setdefault(part, {})
+        node[None] = True
+    return root
+
+
+_HIGH_VALUE_TRIE = _build_trie(HIGH_VALUE_PATHS)
+
+
+def high_value_trie(path):
+    # Component-wise, so unlike startswith() "/lib64" does not match "/lib"
+    node = _HIGH_VALUE_TRIE
+    for part in path[1:].split("/"):
+        node = node.get(part)
+        if node is None:
+            return False
+        if None in node:
+            return True
+    return False
+
+
+_SECRET_ALTERNATION = re.compile(
+    "|".join(f"(?P<g{i}>{p.pattern})" for i, (p, _) in enumerate(SECRET_PATTERNS)), re.I
+)
+_SECRET_LABELS = {f"g{i}": label for i, (_, label) in enumerate(SECRET_PATTERNS)}
+
+
+def secret_label_alternation(key):
+    # Leftmost match rather than first pattern in list order; labels can differ
+    m = _SECRET_ALTERNATION.search(key)
+    return _SECRET_LABELS[m.lastgroup] if m else None
+
+
+# --- harness -----------------------------------------------------------------
+
+CASES = [
+    # (name, generator, [(variant, per-item function)])
+    ("high_value", gen_paths, [
+        ("startswith loop (current)", _is_high_value),
+        ("startswith(tuple)", high_value_tuple),
+        ("prefix trie", high_value_trie),
+    ]),
+    ("env_secret", gen_env_keys, [
+        ("regex list (current)", _secret_label),
+        ("single alternation", secret_label_alternation),
+    ]),
+    ("cron_scripts", gen_cron_lines, [
+        ("CMD_PATTERN.finditer (current)", _script_paths),
+    ]),
+    ("port_parse", gen_ss_lines, [
+        ("token split (current)", _line_ports),
+    ]),
+]
+
+
+def _pass(fn, items):
+    # Keep results alive so retained allocations show up in kept B/item
+    return [fn(item) for item in items]
+
+
+def _transient_bytes(fn, items):
+    """Mean per-call peak of memory allocated and freed again inside fn."""
+    total = 0
+    for item in items:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn(item)
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - current
+    return total / len(items)
+
+
+def measure(fn, items, repeat):
+    _pass(fn, items[:1000])  # warm up regex caches and the like
+    gc.collect()
+    best = None
+    for _ in range(repeat):
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            _pass(fn, items)
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    gc.disable()
+    try:
+        transient = _transient_bytes(fn, items[:TRANSIENT_SAMPLE])
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        results = _pass(fn, items)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        gc.enable()
+        tracemalloc.stop()
+    predicate = all(isinstance(r, bool) for r in results)
+    # The results list itself is not per-item work
+    kept = after - before - sys.getsizeof(results)
+    del results
+    return {
+        "ns_per_item": best / len(items),
+        "transient_bytes_per_item": transient,
+        "kept_bytes_per_item": None if predicate else max(kept, 0) / len(items),
+        "peak_kib": peak / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50000, help="Generated inputs per case")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes; the best is reported")
+    parser.add_argument("--only", default=None, help="Comma-separated case names")
+    parser.add_argument("--json", action="store_true", help="Machine-readable output")
+    args = parser.parse_args()
+
+    only = set(args.only.split(",")) if args.only else None
+    rows = []
+    for name, generate, variants in CASES:
+        if only and name not in only:
+            continue
+        items = generate(args.items, random.Random(SEED))
+        for variant, fn in variants:
+            rows.append({"case": name, "variant": variant, **measure(fn, items, args.repeat)})
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(
+        f"{'case':<14} {'variant':<32} {'ns/item':>9} {'tmp B/item':>11} "
+        f"{'kept B/item':>12} {'peak KiB':>9}"
+    )
+    for r in rows:
+        kept = r["kept_bytes_per_item"]
+        kept = "-" if kept is None else f"{kept:.1f}"
+        print(
+            f"{r['case']:<14} {r['variant']:<32} {r['ns_per_item']:>9.1f} "
+            f"{r['transient_bytes_per_item']:>11.1f} {kept:>12} {r['peak_kib']:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
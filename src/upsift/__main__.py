@@ -1,22 +1,98 @@
+from dataclasses import asdict
+from .checks.base import Finding
 from .cli import build_parser
-from .engine import run_checks, list_checks
+from .engine import stream_checks, list_checks
 from rich.console import Console
 
+def _aggregate(args, console):
+    from rich.table import Table
+    from . import aggregate
+
+    conn = aggregate.connect(args.db)
+    if args.agg_cmd == "ingest":
+        scans, rows, skipped = aggregate.ingest(conn, args.reports, jobs=args.jobs)
+        console.print(
+            f"[green]Ingested {scans} scan(s), {rows} evidence item(s) into {args.db}[/green]"
+        )
+        for path, error in skipped:
+            console.print(f"[yellow]Skipped {path}: {error}[/yellow]")
+        if skipped:
+            console.print(f"[yellow]{len(skipped)} report(s) could not be parsed[/yellow]")
+        return
+    if args.agg_cmd == "hosts":
+        table = Table(title=f"Hosts with {args.check_id}")
+        columns, rows = ("Host", "Items"), aggregate.hosts_with(conn, args.check_id, args.match)
+    elif args.agg_cmd == "counts":
+        table = Table(title="Severity counts (latest scan per host)")
+        columns, rows = ("Severity", "Hosts", "Items"), aggregate.severity_counts(conn)
+    else:
+        table = Table(title="New since last scan")
+        columns = ("Host", "ID", "Severity", "Evidence")
+        rows = aggregate.new_since_last(conn, args.host)
+    for col in columns:
+        table.add_column(col)
+    for row in rows:
+        table.add_row(*(str(v) for v in row))
+    console.print(table)
+
 def main():
     console = Console()
     parser = build_parser()
     args = parser.parse_args()
 
+    if args.cmd == "aggregate":
+        _aggregate(args, console)
+        return
+
     if args.list_checks:
         checks = list_checks()
         for chk in checks:
             console.print(f"[bold]{chk.id}[/bold] - {chk.name} ({chk.severity})")
         return
 
-    results = run_checks(only=args.only, skip=args.skip)
+    from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
+
+    options = {}
+    if args.wordlist:
+        options["wordlist"] = args.wordlist
+        options["wordlist_time"] = args.wordlist_time
+    full = []
+    # Live progress on stderr so --format json output stays clean; Ctrl-C stops the scan and still reports everything found so far
+    with Progress(
+        TextColumn("[bold green]{task.description}"), BarColumn(),
+        TextColumn("{task.fields[found]} finding(s)"), TimeElapsedColumn(),
+        console=Console(stderr=True), transient=True,
+    ) as bar:
+        task = bar.add_task("Starting", total=None, found=0)
+
+        def progress(check_id, done, total):
+            bar.update(task, description=check_id, completed=done, total=total)
+
+        for finding in stream_checks(
+            only=args.only, skip=args.skip, timeout=args.timeout, budget=args.budget,
+            options=options, progress=progress,
+        ):
+            full.append(finding)
+            bar.update(task, found=len(full))
+    results = full
+    if args.baseline:
+        from .report import diff_against, load_baseline
+        new, resolved = diff_against([asdict(f) for f in full], load_baseline(args.baseline))
+        results = [Finding(**d) for d in new]
+        if resolved:
+            results.append(Finding(
+                id="baseline",
+                title=f"{len(resolved)} item(s) resolved since baseline",
+                severity="info",
+                description=f"Evidence present in {args.baseline} but not in this scan.",
+                evidence="\n".join(resolved[:50]),
+                items=resolved,
+                remediation=None,
+                references=[],
+            ))
     if args.format == "json":
         import json
-        print(json.dumps([f._asdict() for f in results], indent=2))
+        print(json.dumps([asdict(f) for f in results], indent=2))
     else:
         # Pretty table
         from rich.table import Table
@@ -33,8 +109,13 @@ def main():
     if args.save_report:
         import json, pathlib
         path = pathlib.Path(args.save_report)
-        path.write_text(json.dumps([f._asdict() for f in results], indent=2))
+        path.write_text(json.dumps([asdict(f) for f in full], indent=2))
         console.print(f"[green]Saved report to {path}[/green]")
 
+    if args.save_baseline:
+        from .report import save_baseline
+        count = save_baseline(args.save_baseline, [asdict(f) for f in full])
+        console.print(f"[green]Saved baseline of {count} item(s) to {args.save_baseline}[/green]")
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,190 @@
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from .report import evidence_items, load_report
+
+BATCH_SIZE = 50_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans(
+    id INTEGER PRIMARY KEY,
+    host TEXT NOT NULL,
+    scan_time REAL NOT NULL,
+    source TEXT NOT NULL,
+    UNIQUE(host, scan_time, source)
+);
+CREATE INDEX IF NOT EXISTS scans_host_time ON scans(host, scan_time);
+CREATE TABLE IF NOT EXISTS items(
+    id INTEGER PRIMARY KEY,
+    check_id TEXT NOT NULL,
+    item TEXT NOT NULL,
+    UNIQUE(check_id, item)
+);
+CREATE TABLE IF NOT EXISTS evidence(
+    scan_id INTEGER NOT NULL,
+    item_id INTEGER NOT NULL,
+    severity TEXT NOT NULL,
+    PRIMARY KEY(scan_id, item_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS evidence_item ON evidence(item_id, scan_id);
+CREATE INDEX IF NOT EXISTS evidence_severity ON evidence(severity);
+"""
+
+# Latest (rn = 1) and previous (rn = 2) scan per host
+RANKED_SCANS = """
+WITH ranked AS (
+    SELECT id, host, scan_time,
+           ROW_NUMBER() OVER (PARTITION BY host ORDER BY scan_time DESC, id DESC) AS rn
+    FROM scans
+)
+"""
+
+Row = Tuple[str, str, str]  # check_id, severity, item
+
+
+def connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _timestamp(value) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _parse(path: str) -> Tuple[str, List[Tuple[str, float, List[Row]]], Optional[str]]:
+    """Worker: read one report into (source, [(host, scan_time, rows)], error).
+
+    NDJSON streams may interleave several hosts and scans; records are grouped
+    by their own host/scan_time, falling back to the file name and mtime.
+    """
+    source = os.path.abspath(path)
+    try:
+        records = load_report(path)
+        default_host = os.path.splitext(os.path.basename(path))[0]
+        default_time = os.path.getmtime(path)
+    except (OSError, ValueError) as e:  # JSONDecodeError is a ValueError
+        return source, [], f"{type(e).__name__}: {e}"
+    groups: Dict[Tuple[str, float], List[Row]] = {}
+    for rec in records:
+        if not isinstance(rec, dict):
+            continue
+        host = rec.get("host") or default_host
+        scan_time = _timestamp(rec.get("scan_time")) or default_time
+        rows = groups.setdefault((host, scan_time), [])
+        check_id = rec.get("id") or "unknown"
+        severity = (rec.get("severity") or "info").lower()
+        for item in evidence_items(rec):
+            rows.append((check_id, severity, item))
+    if not groups:
+        groups[(default_host, default_time)] = []
+    return source, [(h, t, rows) for (h, t), rows in groups.items()], None
+
+
+def _flush(conn: sqlite3.Connection, staged: list) -> None:
+    conn.executemany("INSERT INTO stage VALUES (?, ?, ?, ?)", staged)
+    conn.execute("INSERT OR IGNORE INTO items(check_id, item) SELECT check_id, item FROM stage")
+    conn.execute(
+        "INSERT OR IGNORE INTO evidence(scan_id, item_id, severity) "
+        "SELECT s.scan_id, i.id, s.severity FROM stage s "
+        "JOIN items i ON i.check_id = s.check_id AND i.item = s.item"
+    )
+    conn.execute("DELETE FROM stage")
+    staged.clear()
+
+
+def ingest(
+    conn: sqlite3.Connection, paths: Iterable[str], jobs: Optional[int] = None
+) -> Tuple[int, int, List[Tuple[str, str]]]:
+    """Parse reports in parallel and bulk-load them.
+
+    Returns (scans added, evidence rows, [(path, error)] for unreadable reports,
+    which are skipped without affecting the rest).
+    """
+    paths = list(paths)
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS stage("
+        "scan_id INTEGER, check_id TEXT, severity TEXT, item TEXT)"
+    )
+    scans = rows_total = 0
+    skipped: List[Tuple[str, str]] = []
+    staged: list = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool, conn:
+        for source, groups, error in pool.map(_parse, paths, chunksize=16):
+            if error:
+                skipped.append((source, error))
+                continue
+            for host, scan_time, rows in groups:
+                cur = conn.execute(
+                    "INSERT OR IGNORE INTO scans(host, scan_time, source) VALUES (?, ?, ?)",
+                    (host, scan_time, source),
+                )
+                if not cur.rowcount:
+                    continue  # already ingested
+                scans += 1
+                rows_total += len(rows)
+                scan_id = cur.lastrowid
+                staged.extend((scan_id, c, s, i) for c, s, i in rows)
+                if len(staged) >= BATCH_SIZE:
+                    _flush(conn, staged)
+        if staged:
+            _flush(conn, staged)
+    conn.execute("PRAGMA synchronous=FULL")
+    return scans, rows_total, skipped
+
+
+def hosts_with(
+    conn: sqlite3.Connection, check_id: str, match: Optional[str] = None
+) -> List[tuple]:
+    """Hosts whose latest scan has evidence for check_id (optionally containing `match`)."""
+    sql = RANKED_SCANS + (
+        "SELECT r.host, COUNT(*) FROM ranked r "
+        "JOIN evidence e ON e.scan_id = r.id "
+        "JOIN items i ON i.id = e.item_id "
+        "WHERE r.rn = 1 AND i.check_id = ?"
+    )
+    params: list = [check_id]
+    if match:
+        sql += " AND instr(i.item, ?) > 0"
+        params.append(match)
+    sql += " GROUP BY r.host ORDER BY r.host"
+    return conn.execute(sql, params).fetchall()
+
+
+def severity_counts(conn: sqlite3.Connection) -> List[tuple]:
+    """(severity, hosts, evidence items) across each host's latest scan."""
+    return conn.execute(
+        RANKED_SCANS
+        + "SELECT e.severity, COUNT(DISTINCT r.host), COUNT(*) FROM ranked r "
+        "JOIN evidence e ON e.scan_id = r.id WHERE r.rn = 1 "
+        "GROUP BY e.severity ORDER BY COUNT(*) DESC"
+    ).fetchall()
+
+
+def new_since_last(conn: sqlite3.Connection, host: Optional[str] = None) -> List[tuple]:
+    """(host, check_id, severity, item) present in a host's latest scan but not the one before."""
+    sql = RANKED_SCANS + (
+        "SELECT cur.host, i.check_id, e.severity, i.item FROM ranked cur "
+        "JOIN ranked prev ON prev.host = cur.host AND prev.rn = 2 "
+        "JOIN evidence e ON e.scan_id = cur.id "
+        "JOIN items i ON i.id = e.item_id "
+        "WHERE cur.rn = 1 AND NOT EXISTS ("
+        "SELECT 1 FROM evidence p WHERE p.scan_id = prev.id AND p.item_id = e.item_id)"
+    )
+    params = []
+    if host:
+        sql += " AND cur.host = ?"
+        params.append(host)
+    sql += " ORDER BY cur.host, i.check_id"
+    return conn.execute(sql, params).fetchall()
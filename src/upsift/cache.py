@@ -0,0 +1,64 @@
+import marshal
+import os
+import stat
+import tempfile
+from typing import Any, Optional
+
+
+def cache_dir() -> str:
+    """Per-user cache directory ($UPSIFT_CACHE_DIR, else $XDG_CACHE_HOME/upsift)."""
+    override = os.environ.get("UPSIFT_CACHE_DIR")
+    if override:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "upsift")
+
+
+def _trusted_dir(d: str) -> bool:
+    """True if `d` is a real directory owned by us that nobody else can write to."""
+    try:
+        st = os.lstat(d)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == os.geteuid() and not st.st_mode & 0o022
+
+
+def load(name: str) -> Optional[Any]:
+    """Load a cached object, ignoring files another user could have tampered with."""
+    d = cache_dir()
+    if not _trusted_dir(d):
+        return None
+    try:
+        fd = os.open(os.path.join(d, name), os.O_RDONLY | os.O_NOFOLLOW)
+        with os.fdopen(fd, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_uid != os.geteuid() or st.st_mode & 0o022:
+                return None
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def store(name: str, obj: Any) -> None:
+    """Atomically write a marshal-able object to the cache; failures are ignored.
+
+    Nothing is written unless the cache directory is ours and not writable by
+    others, and the temporary file gets an unpredictable name, so a planted
+    symlink cannot redirect the write when running as root.
+    """
+    d = cache_dir()
+    tmp = None
+    try:
+        os.makedirs(d, mode=0o700, exist_ok=True)
+        if not _trusted_dir(d):
+            return
+        fd, tmp = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=d)
+        with os.fdopen(fd, "wb") as f:
+            marshal.dump(obj, f)
+        os.replace(tmp, os.path.join(d, name))
+    except (OSError, ValueError):
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
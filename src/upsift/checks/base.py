@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import List, Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 @dataclass
 class Finding:
@@ -10,12 +12,49 @@ class Finding:
     evidence: Optional[str] = None
     remediation: Optional[str] = None
     references: Optional[list] = None
+    # Every evidence item when `evidence` shows only the first few; used for baselines
+    items: Optional[List[str]] = None
+
+# progress(check_id, done, total); total is None while the amount of work is unknown
+ProgressCallback = Callable[[str, int, Optional[int]], None]
+
+@dataclass
+class CheckContext:
+    """Run-wide state handed to v2 checks."""
+
+    deadline: Optional[float] = None  # time.monotonic() value under --budget
+    cancel: threading.Event = field(default_factory=threading.Event)  # set on Ctrl-C
+    progress: Optional[ProgressCallback] = None
+    # Shared between checks, e.g. the fsindex walk; entries an isolated worker adds
+    # are sent back to the parent when the check finishes
+    cache: Dict[str, Any] = field(default_factory=dict)
+    options: Dict[str, Any] = field(default_factory=dict)  # CLI settings, e.g. "wordlist"
+
+    def should_stop(self) -> bool:
+        """True once the scan was cancelled or its deadline has passed."""
+        if self.cancel.is_set():
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def report(self, check_id: str, done: int, total: Optional[int] = None) -> None:
+        if self.progress:
+            self.progress(check_id, done, total)
 
 class BaseCheck:
     id = "base"
     name = "Base Check"
     severity = "info"
     description = "Base"
+    # 1: run() returns a list of findings. 2: run(ctx) is a generator yielding findings
+    # as they are found and should return early once ctx.should_stop() is true.
+    api_version = 1
 
     def run(self) -> List[Finding]:
         raise NotImplementedError
+
+    def iter_findings(self, ctx: CheckContext) -> Iterator[Finding]:
+        """Findings from either plugin API, one at a time."""
+        if self.api_version >= 2:
+            yield from self.run(ctx)
+        else:
+            yield from self.run() or []
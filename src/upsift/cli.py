@@ -4,11 +4,71 @@ def build_parser():
     parser = argparse.ArgumentParser(
         prog="upsift", description="Linux misconfiguration and priv-esc detector"
     )
-    parser.add_argument("--format", choices=["table", "json"], default="table")
-    parser.add_argument("--only", help="Comma-separated check IDs to run", default=None)
-    parser.add_argument("--skip", help="Comma-separated check IDs to skip", default=None)
-    parser.add_argument("--save-report", help="Save JSON report to path", default=None)
+    _add_scan_options(parser)
     parser.add_argument("--list-checks", action="store_true", help="List available checks and exit")
     sub = parser.add_subparsers(dest="cmd")
     run = sub.add_parser("run", help="Run all checks (respects --only/--skip)")
+    _add_scan_options(run, suppress=True)
+
+    db = argparse.ArgumentParser(add_help=False)
+    db.add_argument("--db", default="upsift-fleet.db", help="SQLite store path")
+    agg = sub.add_parser("aggregate", help="Aggregate saved reports from many hosts")
+    agg_sub = agg.add_subparsers(dest="agg_cmd", required=True)
+    ingest = agg_sub.add_parser("ingest", parents=[db], help="Load JSON/NDJSON reports")
+    ingest.add_argument("reports", nargs="+", help="Report files (host defaults to file name)")
+    ingest.add_argument("--jobs", type=int, default=None, help="Parallel parser processes")
+    hosts = agg_sub.add_parser("hosts", parents=[db], help="Hosts whose latest scan has a finding")
+    hosts.add_argument("check_id", help="Check ID, e.g. suid_binaries")
+    hosts.add_argument("--match", default=None, help="Only evidence items containing this text")
+    agg_sub.add_parser("counts", parents=[db], help="Severity counts across latest scans")
+    new = agg_sub.add_parser("new", parents=[db], help="Evidence new since each host's last scan")
+    new.add_argument("--host", default=None, help="Limit to one host")
     return parser
+
+
+def _add_scan_options(parser, suppress=False):
+    """Options accepted both before and after `run`.
+
+    The `run` copies default to SUPPRESS so `upsift --timeout 20 run` keeps
+    the value parsed by the top-level parser.
+    """
+
+    def default(value):
+        return argparse.SUPPRESS if suppress else value
+
+    parser.add_argument("--format", choices=["table", "json"], default=default("table"))
+    parser.add_argument("--only", help="Comma-separated check IDs to run", default=default(None))
+    parser.add_argument("--skip", help="Comma-separated check IDs to skip", default=default(None))
+    parser.add_argument("--save-report", help="Save JSON report to path", default=default(None))
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=default(None),
+        help="Run each check in its own process and kill it after this many seconds",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=default(None),
+        help="Total scan time budget in seconds; high-value paths are scanned first "
+        "and partial results are reported when it expires",
+    )
+    parser.add_argument(
+        "--wordlist",
+        default=default(None),
+        help="Test local password hashes against this wordlist (weak_passwords check)",
+    )
+    parser.add_argument(
+        "--wordlist-time",
+        type=float,
+        default=default(None),
+        help="Seconds to spend on the wordlist audit (default 300)",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Prior report or baseline file; only show new and resolved evidence",
+        default=default(None),
+    )
+    parser.add_argument(
+        "--save-baseline", help="Save compact fingerprint baseline to path", default=default(None)
+    )
@@ -1,7 +1,28 @@
 import importlib
+import os
+import pickle
 import pkgutil
-from typing import List, Optional, Type
-from .checks.base import BaseCheck, Finding
+import select
+import signal
+import struct
+import time
+from dataclasses import replace
+from typing import Any, Dict, Iterator, List, Optional, Type
+from .checks.base import BaseCheck, CheckContext, Finding, ProgressCallback
+
+# Seconds a budgeted check may overrun before its worker is killed
+BUDGET_GRACE = 1.0
+
+# How often a waiting parent checks for Ctrl-C to forward to the worker
+CANCEL_POLL = 0.25
+
+# Killed workers stuck in uninterruptible I/O are reaped opportunistically
+_unreaped: List[int] = []
+
+
+class CheckTimeout(Exception):
+    pass
+
 
 def _discover_plugins() -> List[Type[BaseCheck]]:
     import upsift.plugins  # noqa
@@ -21,30 +42,229 @@ def _discover_plugins() -> List[Type[BaseCheck]]:
 def list_checks() -> List[BaseCheck]:
     return [cls() for cls in _discover_plugins()]
 
-def run_checks(only: Optional[str] = None, skip: Optional[str] = None) -> List[Finding]:
+def _reap() -> None:
+    for pid in list(_unreaped):
+        try:
+            done, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            done = pid
+        if done:
+            _unreaped.remove(pid)
+
+def _send(out, kind: str, payload) -> None:
+    data = pickle.dumps((kind, payload))
+    out.write(struct.pack("<I", len(data)) + data)
+    out.flush()
+
+def _stream_isolated(chk: BaseCheck, timeout: float, ctx: CheckContext) -> Iterator[Finding]:
+    """Run chk in a forked worker, yielding its findings as they arrive.
+
+    Findings and progress cross the pipe as length-prefixed pickle frames, so
+    everything sent before the worker is SIGKILLed at `timeout` is kept. Entries
+    the check adds to ctx.cache are merged back once it finishes.
+    """
+    _reap()
+    r, w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(r)
+        # The parent forwards the first Ctrl-C and kills us on the second
+        signal.signal(signal.SIGINT, lambda signum, frame: ctx.cancel.set())
+        try:
+            with os.fdopen(w, "wb") as out:
+                inherited = set(ctx.cache)
+                worker_ctx = replace(ctx, progress=lambda *a: _send(out, "progress", a))
+                try:
+                    for finding in chk.iter_findings(worker_ctx):
+                        _send(out, "finding", finding)
+                except Exception as e:
+                    _send(out, "error", str(e))
+                except KeyboardInterrupt:
+                    pass
+                added = {k: v for k, v in ctx.cache.items() if k not in inherited}
+                if added:
+                    try:
+                        _send(out, "cache", added)
+                    except (pickle.PicklingError, TypeError, AttributeError):
+                        pass  # unpicklable values stay local to this worker
+                _send(out, "done", None)
+        finally:
+            os._exit(0)
+    os.close(w)
+    buf = bytearray()
+    status = None  # None: still running, "done": finished, "eof": died silently
+    error = None
+    forwarded = False
+    deadline = time.monotonic() + timeout
+    try:
+        while status is None:
+            if ctx.cancel.is_set() and not forwarded:
+                os.kill(pid, signal.SIGINT)
+                forwarded = True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if not select.select([r], [], [], min(remaining, CANCEL_POLL))[0]:
+                continue
+            data = os.read(r, 1 << 16)
+            if not data:
+                status = "eof"
+                break
+            buf += data
+            while len(buf) >= 4:
+                size = struct.unpack_from("<I", buf)[0]
+                if len(buf) < 4 + size:
+                    break
+                kind, payload = pickle.loads(bytes(buf[4:4 + size]))
+                del buf[:4 + size]
+                if kind == "finding":
+                    yield payload
+                elif kind == "progress":
+                    ctx.report(*payload)
+                elif kind == "cache":
+                    ctx.cache.update(payload)
+                elif kind == "error":
+                    error = payload
+                else:
+                    status = "done"
+    finally:
+        os.close(r)
+        if status is None:
+            os.kill(pid, signal.SIGKILL)
+            _unreaped.append(pid)
+            _reap()
+    if status is None:
+        raise CheckTimeout(f"Killed after exceeding the {timeout:g}s deadline.")
+    _, wait_status = os.waitpid(pid, 0)
+    if error is not None:
+        raise RuntimeError(error)
+    if status == "eof":
+        raise RuntimeError(f"Check worker died without a result (wait status {wait_status}).")
+
+def _run_isolated(
+    chk: BaseCheck, timeout: float, ctx: Optional[CheckContext] = None
+) -> List[Finding]:
+    """Run chk in a forked worker; SIGKILL it if it overruns `timeout` seconds."""
+    return list(_stream_isolated(chk, timeout, ctx or CheckContext()))
+
+def _error_finding(chk: BaseCheck, title: str, description: str, remediation: str) -> Finding:
+    return Finding(
+        id=chk.id,
+        title=f"{title}: {chk.name}",
+        severity="info",
+        description=description,
+        evidence=None,
+        remediation=remediation,
+        references=[],
+    )
+
+def _share(deadline: float, checks_left: int) -> float:
+    """Deadline for the next check: an even split of what is left of the budget.
+
+    Time a check leaves unused rolls over to the ones after it, so one slow
+    walker cannot starve every check queued behind it.
+    """
+    now = time.monotonic()
+    return now + max(0.0, deadline - now) / checks_left
+
+def stream_checks(
+    only: Optional[str] = None,
+    skip: Optional[str] = None,
+    timeout: Optional[float] = None,
+    budget: Optional[float] = None,
+    options: Optional[Dict[str, Any]] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> Iterator[Finding]:
+    """Run the selected checks, yielding findings as soon as each check produces them.
+
+    Under a `budget`, each check runs to its own share of it (see _share).
+    The first Ctrl-C cancels the scan cooperatively: the running check sees
+    ctx.cancel, returns what it has so far, and remaining checks are skipped.
+    A second Ctrl-C stops the running check immediately.
+    """
     ids_only = set(only.split(",")) if only else None
     ids_skip = set(skip.split(",")) if skip else set()
-    results: List[Finding] = []
-    for cls in _discover_plugins():
-        chk = cls()
-        if ids_only and chk.id not in ids_only:
-            continue
-        if chk.id in ids_skip:
-            continue
-        try:
-            findings = chk.run()
-            if findings:
-                results.extend(findings)
-        except Exception as e:
-            results.append(
-                Finding(
-                    id=chk.id,
-                    title=f"Check error: {chk.name}",
-                    severity="info",
-                    description=str(e),
-                    evidence=None,
-                    remediation="Run with higher privileges or file a bug with stacktrace.",
-                    references=[],
+    deadline = time.monotonic() + budget if budget else None
+    ctx = CheckContext(deadline=deadline, progress=progress, options=dict(options or {}))
+    selected = [
+        chk for chk in (cls() for cls in _discover_plugins())
+        if (not ids_only or chk.id in ids_only) and chk.id not in ids_skip
+    ]
+
+    def _on_sigint(signum, frame):
+        ctx.cancel.set()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    try:
+        previous = signal.signal(signal.SIGINT, _on_sigint)
+    except ValueError:
+        previous = None  # not the main thread; Ctrl-C handling stays with the caller
+    not_run: List[str] = []
+    try:
+        for i, chk in enumerate(selected):
+            if ctx.should_stop():
+                not_run.append(chk.id)
+                continue
+            check_ctx = ctx
+            limit = timeout
+            if deadline is not None:
+                check_ctx = replace(ctx, deadline=_share(deadline, len(selected) - i))
+                # Cooperative checks return partial results at their deadline; the grace
+                # period lets them do so before the worker is killed outright.
+                limit = check_ctx.deadline - time.monotonic() + BUDGET_GRACE
+                if timeout is not None:
+                    limit = min(timeout, limit)
+            ctx.report(chk.id, 0, None)
+            try:
+                stream = (
+                    _stream_isolated(chk, limit, check_ctx) if limit
+                    else chk.iter_findings(check_ctx)
+                )
+                yield from stream
+            except CheckTimeout as e:
+                yield _error_finding(
+                    chk, "Check timed out", str(e),
+                    "Look for hung mounts or slow NSS/LDAP lookups, or raise the limit.",
                 )
-            )
-    return results
+            except KeyboardInterrupt:
+                ctx.cancel.set()
+                yield _error_finding(
+                    chk, "Check interrupted", "Stopped by a second Ctrl-C; results are partial.",
+                    "Re-run the check on its own with --only.",
+                )
+            except Exception as e:
+                yield _error_finding(
+                    chk, "Check error", str(e),
+                    "Run with higher privileges or file a bug with stacktrace.",
+                )
+    finally:
+        if previous is not None:
+            signal.signal(signal.SIGINT, previous)
+    if not_run:
+        if ctx.cancel.is_set():
+            title = f"Scan cancelled: {len(not_run)} check(s) not run"
+            description = "These checks were skipped because the scan was interrupted."
+            remediation = "Re-run the remaining checks with --only."
+        else:
+            title = f"Scan budget of {budget:g}s expired: {len(not_run)} check(s) not run"
+            description = "These checks were skipped because the time budget ran out."
+            remediation = "Re-run with a larger --budget or narrow the scan with --only."
+        yield Finding(
+            id="budget",
+            title=title,
+            severity="info",
+            description=description,
+            evidence="\n".join(not_run),
+            remediation=remediation,
+            references=[],
+        )
+
+def run_checks(
+    only: Optional[str] = None,
+    skip: Optional[str] = None,
+    timeout: Optional[float] = None,
+    budget: Optional[float] = None,
+    options: Optional[Dict[str, Any]] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> List[Finding]:
+    return list(stream_checks(only, skip, timeout, budget, options, progress))
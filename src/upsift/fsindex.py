@@ -0,0 +1,111 @@
+import os
+import stat
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from .checks.base import CheckContext
+from .fswalk import Coverage, DirBatch, stream_local
+from .mounts import DEFAULT_SCAN_KINDS, MOUNTINFO
+from .xattrs import ACL_ACCESS_XATTR, ACL_DEFAULT_XATTR, CAPABILITY_XATTR
+
+# ctx.cache key of the walk shared by the suid, world-writable and capability checks
+CACHE_KEY = "fsindex"
+
+# Fetched for every regular file and directory; one listxattr each, values only when present
+WANTED_XATTRS = frozenset({CAPABILITY_XATTR, ACL_ACCESS_XATTR, ACL_DEFAULT_XATTR})
+
+# Visited first under a time budget: where distro binaries and configuration live
+SCAN_FIRST = [
+    "/etc", "/usr/bin", "/usr/sbin", "/bin", "/sbin", "/usr/local/bin",
+    "/usr/lib", "/usr/libexec", "/lib",
+]
+
+# tmpfs (/tmp on many distros, /dev/shm) is where a dropped SUID shell or cap_setuid
+# binary would sit, so it is walked too; world_writable filters those dirs itself
+SCAN_KINDS = DEFAULT_SCAN_KINDS | {"memory"}
+
+_SPECIAL_BITS = stat.S_ISUID | stat.S_ISGID | stat.S_IWOTH
+
+
+@dataclass
+class Entry:
+    """A file or directory any walker check may care about."""
+
+    path: str
+    mode: int
+    xattrs: Dict[str, bytes] = field(default_factory=dict)  # WANTED_XATTRS present
+
+
+@dataclass
+class FsIndex:
+    entries: List[Entry] = field(default_factory=list)
+    coverage: Coverage = field(default_factory=Coverage)
+
+
+def _record(batch: DirBatch) -> List[Entry]:
+    """SUID/SGID or world-writable regular files, and files or dirs carrying WANTED_XATTRS."""
+    found = []
+    for name, st in batch.entries:
+        mode = st.st_mode
+        regular = stat.S_ISREG(mode)
+        if not (regular or stat.S_ISDIR(mode)):
+            continue
+        path = os.path.join(batch.path, name)
+        entry = None
+        if regular and mode & _SPECIAL_BITS:
+            entry = Entry(path, mode)
+        # Plain absolute paths: going through /proc/self/fd/<fd>/<name> costs the
+        # kernel a procfs lookup per call and measured ~60% slower per listxattr
+        try:
+            present = WANTED_XATTRS.intersection(os.listxattr(path, follow_symlinks=False))
+        except OSError:
+            present = ()
+        for attr in present:
+            try:
+                raw = os.getxattr(path, attr, follow_symlinks=False)
+            except OSError:
+                continue
+            if entry is None:
+                entry = Entry(path, mode)
+            entry.xattrs[attr] = raw
+        if entry is not None:
+            found.append(entry)
+    return found
+
+
+def scan(
+    ctx: CheckContext,
+    check_id: str,
+    select: Callable[[Entry], Optional[Any]],
+    coverage: Coverage,
+) -> Iterator[Any]:
+    """Yield select(entry) for every indexed entry it does not map to None.
+
+    The first check to call this walks the SCAN_KINDS filesystems and yields hits
+    as the walk finds them (`select` then runs in the walker threads); a
+    complete index is kept in ctx.cache so later checks reuse it without
+    touching the disk. An index cut short by a deadline is not reused.
+    `coverage` is filled in with what the walk reached.
+    """
+    cached = ctx.cache.get(CACHE_KEY)
+    if isinstance(cached, FsIndex):
+        index = cached
+        for entry in index.entries:
+            hit = select(entry)
+            if hit is not None:
+                yield hit
+    else:
+        index = FsIndex()
+
+        def visit(batch):
+            entries = _record(batch)
+            index.entries.extend(entries)
+            return [hit for hit in map(select, entries) if hit is not None]
+
+        yield from stream_local(
+            visit, coverage=index.coverage, progress=lambda n: ctx.report(check_id, n, None),
+            kinds=SCAN_KINDS, mountinfo=MOUNTINFO, first=SCAN_FIRST, deadline=ctx.deadline, cancel=ctx.cancel,
+        )
+        if index.coverage.complete:
+            ctx.cache[CACHE_KEY] = index
+    coverage.mounts = list(index.coverage.mounts)
+    coverage.merge(index.coverage)
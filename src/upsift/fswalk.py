@@ -0,0 +1,254 @@
+import os
+import queue
+import stat
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+from .mounts import DEFAULT_SCAN_KINDS, MOUNTINFO, group_by_disk, parse_mountinfo, select_mounts
+
+# Kernel pseudo filesystems that never hold interesting on-disk files
+PSEUDO_DIRS = {"/proc", "/sys", "/dev", "/run"}
+
+# Visited ahead of everything else when a scan is time-budgeted
+PRIORITY_DIRS = [
+    "/etc/cron.d", "/etc/cron.hourly", "/etc/cron.daily", "/etc/cron.weekly", "/etc/cron.monthly",
+    "/var/spool/cron", "/etc/systemd/system", "/lib/systemd/system", "/usr/lib/systemd/system",
+]
+
+# Minimum seconds between progress callbacks from walk_local()
+PROGRESS_INTERVAL = 1.0
+
+# How often stream_local() checks whether the walk has finished
+STREAM_POLL = 0.1
+
+
+@dataclass
+class DirBatch:
+    """One directory's entries, stat'ed relative to an open directory fd."""
+
+    path: str
+    fd: int
+    entries: List[Tuple[str, os.stat_result]]
+
+
+@dataclass
+class Coverage:
+    """How much of the tree a walk reached before its deadline."""
+
+    mounts: List[str] = field(default_factory=list)
+    dirs: int = 0
+    pending: List[str] = field(default_factory=list)  # directories never reached
+
+    @property
+    def complete(self) -> bool:
+        return not self.pending
+
+    def describe(self) -> str:
+        text = f"Scanned {self.dirs} directories on {len(self.mounts)} filesystem(s)"
+        if self.pending:
+            text += f"; {len(self.pending)} directories not reached before the scan stopped"
+        return text + "."
+
+    def merge(self, other: "Coverage") -> None:
+        self.dirs += other.dirs
+        self.pending.extend(other.pending)
+
+
+def priority_dirs(extra: Iterable[str] = ()) -> List[str]:
+    """`extra` plus cron, systemd and $PATH directories, resolved and de-duplicated."""
+    path_dirs = [d for d in os.environ.get("PATH", "").split(":") if d.startswith("/")]
+    ordered = []
+    for d in list(extra) + PRIORITY_DIRS + path_dirs:
+        real = os.path.realpath(d)
+        if real not in ordered and os.path.isdir(real):
+            ordered.append(real)
+    return ordered
+
+
+def walk(
+    roots: Iterable[str],
+    skip: Iterable[str] = PSEUDO_DIRS,
+    xdev: bool = True,
+    deadline: Optional[float] = None,
+    coverage: Optional[Coverage] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Iterator[DirBatch]:
+    """Breadth-first walk yielding a DirBatch per directory.
+
+    Entries are lstat'ed once via fstatat on the directory fd, which stays open
+    while the batch is being consumed so callers can do fd-relative lookups.
+    Roots are visited in the given order and never re-entered from a parent,
+    so listing priority directories before the filesystem root scans them
+    first. Stops at `deadline` (time.monotonic()) or once `cancel` is set,
+    recording unvisited directories in `coverage`.
+    """
+    roots = list(roots)
+    skip = set(skip) | set(roots)
+    queue = deque()
+    for root in roots:
+        try:
+            queue.append((root, os.lstat(root).st_dev))
+        except OSError:
+            continue
+    while queue:
+        if (deadline is not None and time.monotonic() >= deadline) or (
+            cancel is not None and cancel.is_set()
+        ):
+            if coverage is not None:
+                coverage.pending.extend(path for path, _ in queue)
+            return
+        path, dev = queue.popleft()
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+        except OSError:
+            continue
+        try:
+            entries = []
+            try:
+                with os.scandir(fd) as it:
+                    for entry in it:
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        entries.append((entry.name, st))
+                        if stat.S_ISDIR(st.st_mode):
+                            child = os.path.join(path, entry.name)
+                            if child in skip or (xdev and st.st_dev != dev):
+                                continue
+                            queue.append((child, dev))
+            except OSError:
+                continue
+            if coverage is not None:
+                coverage.dirs += 1
+            yield DirBatch(path, fd, entries)
+        finally:
+            os.close(fd)
+
+
+def _owner(path: str, mountpoints: Iterable[str]) -> str:
+    best = "/"
+    for mp in mountpoints:
+        if (path == mp or path.startswith(mp.rstrip("/") + "/")) and len(mp) > len(best):
+            best = mp
+    return best
+
+
+def walk_local(
+    visit: Callable[[DirBatch], None],
+    kinds: Iterable[str] = DEFAULT_SCAN_KINDS,
+    skip: Iterable[str] = (),
+    mountinfo: str = MOUNTINFO,
+    first: Iterable[str] = (),
+    deadline: Optional[float] = None,
+    cancel: Optional[threading.Event] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Coverage:
+    """Walk every selected filesystem, one worker thread per underlying disk.
+
+    `visit` is called from the worker threads, as is `progress`, which gets
+    the number of directories visited so far at most every PROGRESS_INTERVAL.
+    Mounts are classified from mountinfo; by default only local block-backed
+    filesystems are walked, so network, FUSE, pseudo and tmpfs mounts are not
+    entered unless `kinds` asks for them. Each mount is
+    walked up to, but not into, any other mountpoint. With a `deadline`, the
+    directories in `first` plus cron, systemd and $PATH directories are
+    visited before widening breadth-first, and the returned Coverage lists
+    what was not reached; setting `cancel` stops the walk the same way.
+    """
+    mounts = parse_mountinfo(mountinfo)
+    selected = select_mounts(mounts, frozenset(kinds))
+    prune_always = PSEUDO_DIRS | set(skip)
+    priority = priority_dirs(first) if deadline is not None else []
+    coverage = Coverage()
+    visited = 0
+    last_report = time.monotonic()
+    lock = threading.Lock()
+
+    def _visit(batch):
+        nonlocal visited, last_report
+        visit(batch)
+        if progress is None:
+            return
+        with lock:
+            visited += 1
+            now = time.monotonic()
+            if now - last_report < PROGRESS_INTERVAL:
+                return
+            last_report = now
+            done = visited
+        progress(done)
+
+    if not selected:
+        # No usable mountinfo (e.g. /proc not mounted): fall back to a single-device walk
+        coverage.mounts.append("/")
+        for batch in walk(
+            priority + ["/"], prune_always, deadline=deadline, coverage=coverage, cancel=cancel
+        ):
+            _visit(batch)
+        return coverage
+    boundaries = {m.mountpoint for m in mounts}
+    selected_points = {m.mountpoint for m in selected}
+
+    def _walk_group(group):
+        local = Coverage()
+        for m in group:
+            prune = (boundaries - {m.mountpoint}) | prune_always
+            roots = [
+                p for p in priority
+                if _owner(p, boundaries) == m.mountpoint and p not in prune
+            ] + [m.mountpoint]
+            for batch in walk(roots, skip=prune, deadline=deadline, coverage=local, cancel=cancel):
+                _visit(batch)
+        return local
+
+    groups = list(group_by_disk(selected).values())
+    with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+        for fut in [pool.submit(_walk_group, g) for g in groups]:
+            coverage.merge(fut.result())
+    coverage.mounts = sorted(selected_points)
+    return coverage
+
+
+def stream_local(
+    visit: Callable[[DirBatch], Optional[Iterable[Any]]],
+    coverage: Optional[Coverage] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    **kwargs,
+) -> Iterator[Any]:
+    """walk_local() in a background thread, yielding what `visit` returns as it is found.
+
+    `visit` runs in the worker threads and returns an iterable of items (or
+    None). `progress` is called from the consuming thread, so it may write to
+    the same stream as the caller. `coverage` is filled in once the walk ends;
+    other arguments are passed to walk_local().
+    """
+    found: "queue.Queue[Tuple[bool, Any]]" = queue.Queue()  # (is progress, item)
+
+    def _visit(batch):
+        for item in visit(batch) or ():
+            found.put((False, item))
+
+    def _progress(done):
+        found.put((True, done))
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        fut = pool.submit(walk_local, _visit, progress=_progress if progress else None, **kwargs)
+        while True:
+            try:
+                is_progress, item = found.get(timeout=STREAM_POLL)
+            except queue.Empty:
+                if fut.done() and found.empty():
+                    break
+                continue
+            if is_progress:
+                progress(item)
+            else:
+                yield item
+        result = fut.result()
+    if coverage is not None:
+        coverage.mounts = result.mounts
+        coverage.merge(result)
@@ -0,0 +1,130 @@
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, List
+
+MOUNTINFO = "/proc/self/mountinfo"
+
+NETWORK_FSTYPES = {
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "ncpfs", "ceph", "glusterfs", "lustre",
+    "gpfs", "afs", "9p", "virtiofs", "davfs", "beegfs", "orangefs",
+}
+PSEUDO_FSTYPES = {
+    "proc", "sysfs", "devtmpfs", "devpts", "cgroup", "cgroup2", "securityfs", "debugfs",
+    "tracefs", "pstore", "bpf", "mqueue", "hugetlbfs", "configfs", "fusectl", "binfmt_misc",
+    "autofs", "efivarfs", "selinuxfs", "rpc_pipefs", "nsfs",
+}
+MEMORY_FSTYPES = {"tmpfs", "ramfs"}
+IMAGE_FSTYPES = {"squashfs", "iso9660", "erofs"}
+
+# Kinds scanned by default; network and FUSE mounts are skipped by policy
+DEFAULT_SCAN_KINDS = frozenset({"local"})
+
+_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+
+@dataclass
+class Mount:
+    mount_id: int
+    device: str  # major:minor
+    root: str
+    mountpoint: str
+    fstype: str
+    source: str
+    kind: str  # local | network | fuse | pseudo | memory | image | container
+
+
+def _unescape(field: str) -> str:
+    return _ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+
+def classify(fstype: str, device: str, mountpoint: str) -> str:
+    if fstype in NETWORK_FSTYPES:
+        return "network"
+    if fstype.startswith("fuse") and fstype != "fuseblk":
+        return "fuse"
+    if fstype in PSEUDO_FSTYPES:
+        return "pseudo"
+    if fstype in MEMORY_FSTYPES:
+        return "memory"
+    if fstype in IMAGE_FSTYPES:
+        return "image"
+    if fstype == "overlay":
+        # The host root may itself be an overlay; anything else is a container rootfs
+        return "local" if mountpoint == "/" else "container"
+    if device.startswith("0:") and fstype not in ("btrfs", "zfs", "bcachefs"):
+        return "pseudo"
+    return "local"
+
+
+def parse_mountinfo(path: str = MOUNTINFO) -> List[Mount]:
+    mounts = []
+    try:
+        with open(path) as f:
+            lines = f.readlines()
+    except OSError:
+        return mounts
+    for line in lines:
+        pre, sep, post = line.partition(" - ")
+        pre_fields, post_fields = pre.split(), post.split()
+        if not sep or len(pre_fields) < 5 or len(post_fields) < 2:
+            continue
+        mountpoint = _unescape(pre_fields[4])
+        fstype = post_fields[0]
+        mounts.append(Mount(
+            mount_id=int(pre_fields[0]),
+            device=pre_fields[2],
+            root=_unescape(pre_fields[3]),
+            mountpoint=mountpoint,
+            fstype=fstype,
+            source=_unescape(post_fields[1]),
+            kind=classify(fstype, pre_fields[2], mountpoint),
+        ))
+    return mounts
+
+
+def _block_dev(m: Mount) -> str:
+    if not m.device.startswith("0:") or not m.source.startswith("/dev/"):
+        return m.device
+    # btrfs/zfs report an anonymous device; fall back to the backing block device
+    try:
+        rdev = os.stat(m.source).st_rdev
+    except OSError:
+        return m.device
+    return f"{os.major(rdev)}:{os.minor(rdev)}"
+
+
+def disk_of(m: Mount) -> str:
+    """Name of the whole disk behind a mount, so partitions of one disk share a worker."""
+    dev = _block_dev(m)
+    sysdir = f"/sys/dev/block/{dev}"
+    try:
+        real = os.path.realpath(sysdir)
+    except OSError:
+        return dev
+    if os.path.exists(os.path.join(sysdir, "partition")):
+        real = os.path.dirname(real)
+    return os.path.basename(real) if os.path.exists(real) else dev
+
+
+def select_mounts(mounts: List[Mount], kinds=DEFAULT_SCAN_KINDS) -> List[Mount]:
+    """Mounts of the wanted kinds, dropping bind mounts of an already selected filesystem."""
+    # A later mount on the same mountpoint hides the earlier one
+    visible = {m.mountpoint: m for m in mounts}
+    selected = []
+    full_devices = set()
+    # Whole-filesystem mounts first so bind mounts of subtrees can be recognised
+    for m in sorted(visible.values(), key=lambda m: (m.root != "/", len(m.mountpoint))):
+        if m.kind not in kinds or m.device in full_devices:
+            continue
+        if m.root == "/":
+            full_devices.add(m.device)
+        selected.append(m)
+    return selected
+
+
+def group_by_disk(mounts: List[Mount]) -> Dict[str, List[Mount]]:
+    groups: Dict[str, List[Mount]] = {}
+    for m in mounts:
+        groups.setdefault(disk_of(m), []).append(m)
+    return groups
@@ -0,0 +1,229 @@
+import os
+import stat
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+# Overlay storage directories laid out as <root>/<layer>/{diff,lower,link} (Docker, Podman)
+OVERLAY_ROOTS = [
+    "/var/lib/docker/overlay2",
+    "/var/lib/containers/storage/overlay",
+]
+
+# Docker keeps container id -> rw layer id here
+DOCKER_LAYERDB_MOUNTS = "/var/lib/docker/image/overlay2/layerdb/mounts"
+
+WHITEOUT_PREFIX = ".wh."
+OPAQUE_MARKER = ".wh..wh..opq"
+
+
+@dataclass
+class LayerResult:
+    root: str
+    hits: Dict[str, str] = field(default_factory=dict)  # relpath -> suid|sgid|world_writable
+    whiteouts: Set[str] = field(default_factory=set)
+    opaque: Set[str] = field(default_factory=set)
+    complete: bool = True  # False if the scan stopped before walking the whole layer
+
+
+@dataclass
+class Rootfs:
+    name: str
+    layers: List[str]  # diff directories, topmost first
+
+
+def _layer_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _docker_names() -> Dict[str, str]:
+    names = {}
+    try:
+        for cid in os.listdir(DOCKER_LAYERDB_MOUNTS):
+            try:
+                with open(os.path.join(DOCKER_LAYERDB_MOUNTS, cid, "mount-id")) as f:
+                    names[f.read().strip()] = cid[:12]
+            except OSError:
+                continue
+    except OSError:
+        pass
+    return names
+
+
+def _storage_rootfs(root: str) -> List[Rootfs]:
+    try:
+        layer_ids = [d for d in os.listdir(root) if d != "l"]
+    except OSError:
+        return []
+    chains: Dict[str, List[str]] = {}
+    referenced: Set[str] = set()
+    for lid in layer_ids:
+        diff = os.path.join(root, lid, "diff")
+        if not os.path.isdir(diff):
+            continue
+        lowers = []
+        try:
+            with open(os.path.join(root, lid, "lower")) as f:
+                for link in f.read().strip().split(":"):
+                    if link:
+                        lowers.append(os.path.realpath(os.path.join(root, link)))
+        except OSError:
+            pass
+        chains[lid] = [os.path.realpath(diff)] + lowers
+        referenced.update(lowers)
+    names = _docker_names()
+    return [
+        Rootfs(name=names.get(lid, lid[:12]), layers=layers)
+        for lid, layers in chains.items()
+        if layers[0] not in referenced
+    ]
+
+
+def _mounted_rootfs(mountinfo: str) -> List[Rootfs]:
+    found = []
+    try:
+        with open(mountinfo) as f:
+            lines = f.readlines()
+    except OSError:
+        return found
+    for line in lines:
+        pre, _, post = line.partition(" - ")
+        post_fields = post.split()
+        if len(post_fields) < 3 or post_fields[0] != "overlay":
+            continue
+        opts = {}
+        for opt in post_fields[2].split(","):
+            key, _, value = opt.partition("=")
+            opts[key] = value
+        if "upperdir" not in opts or "lowerdir" not in opts:
+            continue
+        layers = [opts["upperdir"]] + [p for p in opts["lowerdir"].split(":") if p]
+        found.append(Rootfs(name=pre.split()[4], layers=layers))
+    return found
+
+
+def discover_rootfs(
+    roots: Optional[List[str]] = None, mountinfo: str = "/proc/self/mountinfo"
+) -> List[Rootfs]:
+    """Container root filesystems from overlay storage and live overlay mounts."""
+    seen = set()
+    result = []
+    candidates = []
+    for root in roots if roots is not None else OVERLAY_ROOTS:
+        candidates.extend(_storage_rootfs(root))
+    candidates.extend(_mounted_rootfs(mountinfo))
+    for rfs in candidates:
+        key = _layer_key(rfs.layers[0])
+        if key is None or key in seen:
+            continue
+        seen.add(key)
+        result.append(rfs)
+    return result
+
+
+def scan_layer(
+    root: str, deadline: Optional[float] = None, cancel: Optional[threading.Event] = None
+) -> LayerResult:
+    """Record SUID/SGID and world-writable files plus whiteouts in a single layer.
+
+    Stops at `deadline` (time.monotonic()) or once `cancel` is set, leaving
+    the result marked incomplete.
+    """
+    res = LayerResult(root=root)
+    stack = [""]
+    while stack:
+        if (deadline is not None and time.monotonic() >= deadline) or (
+            cancel is not None and cancel.is_set()
+        ):
+            res.complete = False
+            break
+        rel = stack.pop()
+        try:
+            it = os.scandir(os.path.join(root, rel) if rel else root)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                relpath = os.path.join(rel, name) if rel else name
+                if name == OPAQUE_MARKER:
+                    res.opaque.add(rel)
+                    continue
+                if name.startswith(WHITEOUT_PREFIX):
+                    res.whiteouts.add(os.path.join(rel, name[len(WHITEOUT_PREFIX):]))
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                mode = st.st_mode
+                if stat.S_ISDIR(mode):
+                    try:
+                        if os.getxattr(entry.path, "trusted.overlay.opaque") == b"y":
+                            res.opaque.add(relpath)
+                    except OSError:
+                        pass
+                    stack.append(relpath)
+                elif stat.S_ISCHR(mode) and st.st_rdev == 0:
+                    res.whiteouts.add(relpath)
+                elif stat.S_ISREG(mode):
+                    if mode & stat.S_ISUID:
+                        res.hits[relpath] = "suid"
+                    elif mode & stat.S_ISGID:
+                        res.hits[relpath] = "sgid"
+                    elif mode & stat.S_IWOTH:
+                        res.hits[relpath] = "world_writable"
+    return res
+
+
+def _hidden_by(upper: LayerResult, relpath: str) -> bool:
+    if relpath in upper.whiteouts or os.path.lexists(os.path.join(upper.root, relpath)):
+        return True
+    parent = os.path.dirname(relpath)
+    while parent:
+        if parent in upper.whiteouts or parent in upper.opaque:
+            return True
+        parent = os.path.dirname(parent)
+    return "" in upper.opaque
+
+
+def compose(layers: List[LayerResult]) -> Dict[str, str]:
+    """Merge per-layer hits topmost first, honouring overlay shadowing and whiteouts."""
+    visible: Dict[str, str] = {}
+    for i, layer in enumerate(layers):
+        for relpath, kind in layer.hits.items():
+            if relpath in visible:
+                continue
+            if any(_hidden_by(upper, relpath) for upper in layers[:i]):
+                continue
+            visible[relpath] = kind
+    return visible
+
+
+class LayerCache:
+    """Scan results keyed by layer directory identity so shared layers are walked once."""
+
+    def __init__(self):
+        self._results: Dict[Tuple[int, int], LayerResult] = {}
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(
+        self,
+        path: str,
+        deadline: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Optional[LayerResult]:
+        key = _layer_key(path)
+        if key is None:
+            return None
+        res = self._results.get(key)
+        if res is None:
+            res = self._results[key] = scan_layer(path, deadline=deadline, cancel=cancel)
+        return res
@@ -0,0 +1,57 @@
+import functools
+import os
+import stat
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=None)
+def _node_risk(path: str) -> Optional[str]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    mode = st.st_mode
+    # A sticky directory only lets users replace their own entries
+    shared = stat.S_ISDIR(mode) and mode & stat.S_ISVTX
+    if mode & stat.S_IWOTH and not shared:
+        return f"{path} is world-writable"
+    if st.st_uid != 0:
+        return f"{path} is owned by uid {st.st_uid}"
+    if mode & stat.S_IWGRP and st.st_gid != 0 and not shared:
+        return f"{path} is group-writable by gid {st.st_gid}"
+    if os.geteuid() != 0 and os.access(path, os.W_OK):
+        return f"{path} is writable by the current user"
+    return None
+
+
+def _chain_risk(path: str) -> Optional[str]:
+    while True:
+        risk = _node_risk(path)
+        if risk:
+            return risk
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+@functools.lru_cache(maxsize=None)
+def write_risk(path: str, resolve: bool = True) -> Optional[str]:
+    """Why a non-root user could replace or modify `path`, or None if only root can.
+
+    The resolved file and every ancestor directory are checked (plus the
+    directory holding the symlink, if `path` is one). Results are cached per
+    path, so many files under the same directories cost one stat each.
+    Pass resolve=False for paths below /proc/<pid>/root, whose magic link
+    realpath() would rewrite to a path in our own mount namespace.
+    """
+    real = os.path.realpath(path) if resolve else path
+    risk = _chain_risk(real)
+    if risk is None and real != path:
+        risk = _chain_risk(os.path.dirname(path))
+    return risk
+
+
+def clear_cache() -> None:
+    _node_risk.cache_clear()
+    write_risk.cache_clear()
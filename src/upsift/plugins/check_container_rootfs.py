@@ -0,0 +1,121 @@
+from collections import defaultdict
+from upsift.checks.base import BaseCheck, Finding
+from upsift.overlay import LayerCache, compose, discover_rootfs
+from upsift.suiddb import SuidIndex
+
+KIND_LABELS = {
+    "suid": "SUID",
+    "sgid": "SGID",
+    "world_writable": "world-writable",
+}
+
+
+class ContainerRootfsCheck(BaseCheck):
+    id = "container_rootfs"
+    name = "Container root filesystems"
+    severity = "medium"
+    description = (
+        "Scans container root filesystems in local overlay storage for unusual or "
+        "exploitable SUID/SGID binaries and world-writable files. Shared image layers are scanned once and reused for "
+        "every container built on them."
+    )
+
+    api_version = 2
+
+    def run(self, ctx):
+        findings = []
+        rootfs_list = discover_rootfs()
+        if not rootfs_list:
+            return
+
+        cache = LayerCache()
+        # (relpath, kind) -> names of containers where the file is visible
+        seen = defaultdict(list)
+        partial = []
+        for done, rfs in enumerate(rootfs_list):
+            if ctx.should_stop():
+                partial.extend(r.name for r in rootfs_list[done:])
+                break
+            ctx.report(self.id, done, len(rootfs_list))
+            layers = [
+                res for res in (
+                    cache.get(p, deadline=ctx.deadline, cancel=ctx.cancel) for p in rfs.layers
+                ) if res is not None
+            ]
+            if not all(res.complete for res in layers):
+                partial.append(rfs.name)
+            for relpath, kind in compose(layers).items():
+                seen[(relpath, kind)].append(rfs.name)
+
+        # Stock su/passwd/mount in every image are expected; only unknown or
+        # exploitable SUID/SGID binaries are reported
+        index = SuidIndex.load()
+        privileged = []
+        exploitable = False
+        writable = []
+        for (relpath, kind), names in sorted(seen.items()):
+            shown = ", ".join(names[:5]) + (", …" if len(names) > 5 else "")
+            where = f"in {len(names)} container(s): {shown}"
+            if kind == "world_writable":
+                writable.append(f"/{relpath} ({KIND_LABELS[kind]}) — {where}")
+                continue
+            rating, technique = index.classify("/" + relpath)
+            if rating == "safe":
+                continue
+            exploitable = exploitable or rating in ("critical", "high")
+            label = f"{rating}: {technique}" if technique else rating
+            privileged.append(f"/{relpath} ({KIND_LABELS[kind]}, {label}) — {where}")
+
+        summary = f"Scanned {len(rootfs_list)} container rootfs across {len(cache)} unique layer(s)."
+        if privileged:
+            findings.append(Finding(
+                id=self.id,
+                title=(
+                    f"Found {len(privileged)} unusual or exploitable SUID/SGID file(s) "
+                    "in container images"
+                ),
+                severity="high" if exploitable else "medium",
+                description=f"{self.description} {summary}",
+                evidence="\n".join(privileged[:50]),
+                items=privileged,
+                remediation=(
+                    "Rebuild images without unnecessary SUID/SGID bits "
+                    "('RUN chmod a-s /path/bin') and run containers with "
+                    "'--security-opt no-new-privileges'."
+                ),
+                references=[
+                    "https://docs.docker.com/engine/security/",
+                    "https://gtfobins.github.io/",
+                ],
+            ))
+        if writable:
+            findings.append(Finding(
+                id=self.id,
+                title=f"Found {len(writable)} world-writable file(s) in container images",
+                severity="medium",
+                description=f"{self.description} {summary}",
+                evidence="\n".join(writable[:50]),
+                items=writable,
+                remediation="Remove world-write permission in the image build: 'chmod o-w /path/to/file'.",
+                references=["https://attack.mitre.org/techniques/T1222/"],
+            ))
+        if partial:
+            findings.append(Finding(
+                id=self.id,
+                title="Container rootfs scan incomplete: scan stopped early",
+                severity="info",
+                description=f"{summary} These root filesystems were not fully scanned.",
+                evidence="\n".join(partial[:30]),
+                remediation="Re-run without interruption, or with a larger --budget, for full coverage.",
+                references=[],
+            ))
+        elif not findings:
+            findings.append(Finding(
+                id=self.id,
+                title="No risky files found in container root filesystems",
+                severity="info",
+                description=summary,
+                remediation=None,
+                references=[],
+            ))
+        yield from findings
@@ -42,6 +42,7 @@ class CronWriteCheck(BaseCheck):
                 severity="high",
                 description=self.description,
                 evidence="\n".join(risky[:50]),
+                items=risky,
                 remediation="Set correct permissions and ownership on cron files and directories.",
                 references=["https://wiki.archlinux.org/title/Cron"],
             ))
@@ -18,6 +18,10 @@ CRON_FILES = [
 CMD_PATTERN = re.compile(r"(/[\w/.\-_]+\.(sh|py|pl|rb|php|bash))")
 
 
+def _script_paths(line):
+    return [match.group(1) for match in CMD_PATTERN.finditer(line)]
+
+
 class CrontabHijackCheck(BaseCheck):
     id = "crontab_hijack"
     name = "Crontab script hijack"
@@ -62,8 +66,7 @@ class CrontabHijackCheck(BaseCheck):
         cron_lines = self._get_cron_lines()
 
         for line in cron_lines:
-            for match in CMD_PATTERN.finditer(line):
-                script_path = match.group(1)
+            for script_path in _script_paths(line):
                 p = pathlib.Path(script_path)
                 if p.exists() and os.access(str(p), os.W_OK):
                     hijackable.append(f"{script_path} (writable) — in cron: {line[:80]}")
@@ -26,6 +26,13 @@ def _mask(value: str) -> str:
     return value[:4] + "*" * min(len(value) - 4, 20)
 
 
+def _secret_label(key):
+    for pattern, label in SECRET_PATTERNS:
+        if pattern.search(key):
+            return label
+    return None
+
+
 class EnvVariablesCheck(BaseCheck):
     id = "env_variables"
     name = "Secrets in environment variables"
@@ -42,10 +49,9 @@ class EnvVariablesCheck(BaseCheck):
         for key, value in os.environ.items():
             if key in SAFE_VARS or not value.strip():
                 continue
-            for pattern, label in SECRET_PATTERNS:
-                if pattern.search(key):
-                    leaked.append(f"{label}: {key}={_mask(value)}")
-                    break
+            label = _secret_label(key)
+            if label:
+                leaked.append(f"{label}: {key}={_mask(value)}")
 
         if leaked:
             findings.append(Finding(
@@ -0,0 +1,163 @@
+import grp
+import pwd
+from upsift.checks.base import BaseCheck, Finding
+from upsift import fsindex
+from upsift.fswalk import Coverage
+from upsift.xattrs import (
+    ACL_DEFAULT_XATTR,
+    ACL_USER,
+    CAPABILITY_XATTR,
+    acl_named_writers,
+    decode_acl,
+    decode_capability,
+)
+
+# Capabilities that hand out root-equivalent power to whoever runs the binary
+RISKY_CAPS = {
+    "cap_setuid": "change UID to root",
+    "cap_setgid": "change GID to root",
+    "cap_dac_override": "bypass file permission checks",
+    "cap_dac_read_search": "read any file (e.g. /etc/shadow)",
+    "cap_chown": "take ownership of any file",
+    "cap_fowner": "bypass owner checks, chmod any file",
+    "cap_sys_admin": "mount filesystems and much more",
+    "cap_sys_ptrace": "inject code into root processes",
+    "cap_sys_module": "load kernel modules",
+    "cap_sys_rawio": "raw access to devices and memory",
+    "cap_setfcap": "grant capabilities to other files",
+    "cap_setpcap": "modify process capability sets",
+    "cap_bpf": "load BPF programs",
+}
+
+# Named-writer ACLs only matter where the file controls privileged behaviour
+ACL_SENSITIVE_PREFIXES = ("/etc", "/usr", "/bin", "/sbin", "/lib", "/boot", "/root", "/opt")
+
+
+def _risky_caps(caps):
+    """(granted, inheritable_only) risky capability names for a file.
+
+    Only the permitted set is granted on exec; file-inheritable bits are ANDed
+    with the caller's inheritable set, so they grant nothing to a normal user.
+    """
+    granted = sorted(caps.permitted & RISKY_CAPS.keys())
+    inheritable_only = sorted((caps.inheritable - caps.permitted) & RISKY_CAPS.keys())
+    return granted, inheritable_only
+
+
+def _principal(entry):
+    try:
+        if entry.tag == ACL_USER:
+            return "user:" + pwd.getpwuid(entry.id).pw_name
+        return "group:" + grp.getgrgid(entry.id).gr_name
+    except (KeyError, TypeError):
+        return ("user:" if entry.tag == ACL_USER else "group:") + str(entry.id)
+
+
+class FileCapabilitiesCheck(BaseCheck):
+    id = "file_capabilities"
+    name = "File capabilities and ACLs"
+    severity = "high"
+    description = (
+        "Finds binaries carrying dangerous file capabilities (cap_setuid, cap_dac_override, ...) "
+        "which are as powerful as SUID root, and POSIX ACLs granting extra users write "
+        "access to system files."
+    )
+
+    api_version = 2
+
+    def run(self, ctx):
+        risky_caps = []
+        inheritable_caps = []
+        acl_writers = []
+
+        def select(entry):
+            path = entry.path
+            hit = None
+            for attr, raw in entry.xattrs.items():
+                if attr == CAPABILITY_XATTR:
+                    caps = decode_capability(raw)
+                    if caps is None:
+                        continue
+                    granted, inheritable_only = _risky_caps(caps)
+                    if granted:
+                        detail = ", ".join(f"{c} ({RISKY_CAPS[c]})" for c in granted)
+                        flag = "+ep" if caps.effective else "+p"
+                        if caps.rootid:
+                            flag += f" (user namespace rootid {caps.rootid})"
+                        hit = (path, f"{path} {flag}: {detail}")
+                    if inheritable_only:
+                        inheritable_caps.append(f"{path} +i: {', '.join(inheritable_only)}")
+                elif path.startswith(ACL_SENSITIVE_PREFIXES):
+                    writers = acl_named_writers(decode_acl(raw))
+                    if writers:
+                        kind = "default ACL" if attr == ACL_DEFAULT_XATTR else "ACL"
+                        who = ", ".join(_principal(e) for e in writers)
+                        acl_writers.append(f"{path} ({kind}): writable by {who}")
+            return hit
+
+        # Dangerous capabilities are reported as soon as the shared walk finds them
+        coverage = Coverage()
+        for path, line in fsindex.scan(ctx, self.id, select, coverage):
+            risky_caps.append(line)
+            yield Finding(
+                id=self.id,
+                title=f"File with dangerous capabilities: {path}",
+                severity="high",
+                description=self.description,
+                evidence=line,
+                remediation=(
+                    "Remove capabilities that are not required: 'setcap -r /path/bin'. "
+                    "Audit with 'getcap -r / 2>/dev/null'."
+                ),
+                references=[
+                    "https://man7.org/linux/man-pages/man7/capabilities.7.html",
+                    "https://gtfobins.github.io/#+capabilities",
+                ],
+            )
+        inheritable_caps.sort()
+        acl_writers.sort()
+
+        if acl_writers:
+            yield Finding(
+                id=self.id,
+                title=f"Found {len(acl_writers)} system path(s) with write-granting ACLs",
+                severity="medium",
+                description=self.description,
+                evidence="\n".join(acl_writers[:50]),
+                items=acl_writers,
+                remediation="Remove extra ACL entries: 'setfacl -x u:<user> /path' or 'setfacl -b /path'.",
+                references=["https://man7.org/linux/man-pages/man5/acl.5.html"],
+            )
+        if inheritable_caps:
+            yield Finding(
+                id=self.id,
+                title=f"Found {len(inheritable_caps)} file(s) with inheritable-only capabilities",
+                severity="info",
+                description=(
+                    "File-inheritable capabilities only take effect for callers that already "
+                    "hold them in their inheritable set (e.g. via pam_cap or ambient caps)."
+                ),
+                evidence="\n".join(inheritable_caps[:50]),
+                items=inheritable_caps,
+                remediation="Review whether any PAM or service configuration grants these to users.",
+                references=["https://man7.org/linux/man-pages/man7/capabilities.7.html"],
+            )
+        if not coverage.complete:
+            yield Finding(
+                id=self.id,
+                title="File capability scan incomplete: scan stopped early",
+                severity="info",
+                description=coverage.describe(),
+                evidence="\n".join(coverage.pending[:30]),
+                remediation="Re-run without interruption, or with a larger --budget, for full coverage.",
+                references=[],
+            )
+        elif not (risky_caps or acl_writers):
+            yield Finding(
+                id=self.id,
+                title="No dangerous file capabilities or ACLs found",
+                severity="info",
+                description="No files carry risky capabilities and no system paths have write-granting ACLs.",
+                remediation=None,
+                references=[],
+            )
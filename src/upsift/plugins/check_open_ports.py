@@ -15,6 +15,22 @@ SUSPICIOUS_PORTS = {
 }
 
 
+def _line_ports(line):
+    """Ports in one line of `ss -tlnp` / `netstat -tlnp` output."""
+    line = line.strip()
+    if not line or line.startswith("State") or line.startswith("Proto"):
+        return []
+    ports = []
+    # Extract port from address like 0.0.0.0:4444 or *:4444
+    for part in line.split():
+        if ":" in part:
+            try:
+                ports.append(int(part.rsplit(":", 1)[-1]))
+            except ValueError:
+                continue
+    return ports
+
+
 class OpenPortsCheck(BaseCheck):
     id = "open_ports"
     name = "Suspicious open ports"
@@ -56,20 +72,10 @@ class OpenPortsCheck(BaseCheck):
         all_listening = []
 
         for line in out.splitlines():
-            line = line.strip()
-            if not line or line.startswith("State") or line.startswith("Proto"):
-                continue
-            parts = line.split()
-            # Extract port from address like 0.0.0.0:4444 or *:4444
-            for part in parts:
-                if ":" in part:
-                    try:
-                        port = int(part.rsplit(":", 1)[-1])
-                        all_listening.append(port)
-                        if port in SUSPICIOUS_PORTS:
-                            flagged.append(f"Port {port} — {SUSPICIOUS_PORTS[port]}")
-                    except ValueError:
-                        continue
+            for port in _line_ports(line):
+                all_listening.append(port)
+                if port in SUSPICIOUS_PORTS:
+                    flagged.append(f"Port {port} — {SUSPICIOUS_PORTS[port]}")
 
         if flagged:
             findings.append(Finding(
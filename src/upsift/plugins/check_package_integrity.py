@@ -0,0 +1,270 @@
+import glob
+import hashlib
+import mmap
+import os
+import shutil
+import stat
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from upsift import cache
+from upsift.checks.base import BaseCheck, Finding
+
+# Directories whose every file is treated as privileged
+PRIVILEGED_DIRS = [
+    "/usr/bin", "/usr/sbin", "/bin", "/sbin", "/usr/local/bin", "/usr/local/sbin",
+]
+
+# Locally installed software is expected to be unowned unless it is SUID/SGID
+LOCAL_DIRS = ("/usr/local/",)
+
+DPKG_MD5SUMS = "/var/lib/dpkg/info/*.md5sums"
+RPM_QUERY = [
+    # Scalar tags need "=" inside an array iterator or rpm rejects the sizes as mismatched
+    "rpm", "-qa", "--qf", "[%{FILENAMES}\t%{FILEDIGESTS}\t%{=FILEDIGESTALGO}\t%{=NAME}\n]",
+]
+RPM_DIGEST_ALGOS = {"1": "md5", "2": "sha1", "8": "sha256", "9": "sha384", "10": "sha512"}
+
+CACHE_NAME = "package-digests"
+CHUNK_SIZE = 1 << 20
+MMAP_THRESHOLD = 4 << 20
+
+
+class _RealDirs(dict):
+    """Memoised realpath() of directory names so /bin and /usr/bin entries collapse."""
+
+    def __missing__(self, d):
+        real = self[d] = os.path.realpath(d)
+        return real
+
+    def resolve(self, path):
+        d, base = os.path.split(path)
+        return os.path.join(self[d], base)
+
+
+def _load_dpkg(realdirs, owned):
+    for md5sums in glob.glob(DPKG_MD5SUMS):
+        package = os.path.basename(md5sums)[: -len(".md5sums")].split(":")[0]
+        try:
+            with open(md5sums, errors="ignore") as f:
+                for line in f:
+                    digest, _, rel = line.rstrip("\n").partition("  ")
+                    if rel:
+                        owned[realdirs.resolve("/" + rel)] = ("md5", digest, package)
+        except OSError:
+            continue
+
+
+def _load_rpm(realdirs, owned):
+    if not shutil.which("rpm") or not os.path.isdir("/var/lib/rpm"):
+        return
+    out = subprocess.check_output(RPM_QUERY, text=True, timeout=60, stderr=subprocess.PIPE)
+    for line in out.splitlines():
+        parts = line.split("\t")
+        if len(parts) != 4 or not parts[1]:
+            continue
+        path, digest, algo, package = parts
+        owned[realdirs.resolve(path)] = (RPM_DIGEST_ALGOS.get(algo, "md5"), digest, package)
+
+
+def _hash_file(path, algo):
+    h = hashlib.new(algo)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        else:
+            buf = bytearray(CHUNK_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                h.update(view[:n])
+    return h.hexdigest()
+
+
+def _digests(candidates, owned, cached, deadline=None, cancel=None):
+    """Digest every package-owned candidate, reusing cached digests whose stat key is unchanged.
+
+    Entries are (ino, size, mtime_ns, ctime_ns, algo, digest). SUID/SGID files
+    are hashed first; files not reached by `deadline` or `cancel` are left out.
+    """
+    digests = {}
+    to_hash = []
+    for path, st in candidates.items():
+        if path not in owned:
+            continue
+        algo = owned[path][0]
+        key = (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns, algo)
+        hit = cached.get(path)
+        if hit is not None and tuple(hit[:5]) == key:
+            digests[path] = hit
+        else:
+            to_hash.append((path, key))
+    to_hash.sort(key=lambda item: not candidates[item[0]].st_mode & (stat.S_ISUID | stat.S_ISGID))
+
+    def _work(item):
+        path, key = item
+        if (deadline is not None and time.monotonic() >= deadline) or (
+            cancel is not None and cancel.is_set()
+        ):
+            return path, None
+        try:
+            return path, key + (_hash_file(path, key[4]),)
+        except (OSError, ValueError):
+            return path, None
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2)) as pool:
+        for path, entry in pool.map(_work, to_hash):
+            if entry is not None:
+                digests[path] = entry
+    return digests
+
+
+class PackageIntegrityCheck(BaseCheck):
+    id = "package_integrity"
+    name = "Package integrity of privileged binaries"
+    severity = "high"
+    description = (
+        "Verifies SUID/SGID binaries and system bin directories against the digests "
+        "recorded by dpkg or rpm. Modified or unowned privileged binaries may be "
+        "trojaned replacements planted for persistence or privilege escalation."
+    )
+
+    def _candidates(self, realdirs, owned):
+        """Files in privileged dirs plus package-owned SUID/SGID files elsewhere."""
+        found = {}
+        for d in PRIVILEGED_DIRS:
+            real = realdirs[d]
+            try:
+                with os.scandir(real) as it:
+                    for entry in it:
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        if stat.S_ISREG(st.st_mode):
+                            found[os.path.join(real, entry.name)] = st
+            except OSError:
+                continue
+        for path in owned:
+            if path in found:
+                continue
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode) and st.st_mode & (stat.S_ISUID | stat.S_ISGID):
+                found[path] = st
+        return found
+
+    api_version = 2
+
+    def run(self, ctx):
+        findings = []
+        realdirs = _RealDirs()
+        owned = {}
+        _load_dpkg(realdirs, owned)
+        try:
+            _load_rpm(realdirs, owned)
+        except (OSError, subprocess.SubprocessError) as e:
+            detail = getattr(e, "stderr", None) or str(e)
+            findings.append(Finding(
+                id=self.id,
+                title="rpm database query failed",
+                severity="info",
+                description=f"Could not list rpm file digests: {detail.strip()}",
+                remediation="Verify binaries manually: 'rpm -Va'.",
+                references=[],
+            ))
+        if not owned:
+            if not findings:
+                findings.append(Finding(
+                    id=self.id,
+                    title="No package database found",
+                    severity="info",
+                    description="Neither dpkg md5sums nor an rpm database could be read.",
+                    remediation="Verify binaries manually: 'debsums -s' or 'rpm -Va'.",
+                    references=[],
+                ))
+            yield from findings
+            return
+
+        candidates = self._candidates(realdirs, owned)
+        cached = cache.load(CACHE_NAME)
+        if not isinstance(cached, dict):
+            cached = {}
+        digests = _digests(candidates, owned, cached, deadline=ctx.deadline, cancel=ctx.cancel)
+        unverified = [p for p in candidates if p in owned and p not in digests]
+        stopped = ctx.should_stop()
+        # Keep earlier digests for files this run never reached
+        cache.store(CACHE_NAME, {**cached, **digests} if stopped else digests)
+
+        modified = []
+        unowned = []
+        for path, st in sorted(candidates.items()):
+            privileged = st.st_mode & (stat.S_ISUID | stat.S_ISGID)
+            tag = " (SUID/SGID)" if privileged else ""
+            if path in owned:
+                entry = digests.get(path)
+                if entry is not None and entry[5] != owned[path][1].lower():
+                    modified.append(f"{path}{tag} — package {owned[path][2]}")
+            elif privileged or not path.startswith(LOCAL_DIRS):
+                unowned.append(f"{path}{tag}")
+
+        if modified:
+            findings.append(Finding(
+                id=self.id,
+                title=f"Found {len(modified)} modified package binaries",
+                severity="high",
+                description=self.description,
+                evidence="\n".join(modified[:50]),
+                items=modified,
+                remediation=(
+                    "Reinstall the owning package ('apt install --reinstall <pkg>' or "
+                    "'dnf reinstall <pkg>') and investigate how the file was changed."
+                ),
+                references=[
+                    "https://attack.mitre.org/techniques/T1554/",
+                    "https://manpages.debian.org/debsums",
+                ],
+            ))
+        if unowned:
+            findings.append(Finding(
+                id=self.id,
+                title=f"Found {len(unowned)} privileged binaries not owned by any package",
+                severity="medium",
+                description=self.description,
+                evidence="\n".join(unowned[:50]),
+                items=unowned,
+                remediation=(
+                    "Confirm the origin of each file. Remove unknown binaries or their "
+                    "SUID/SGID bits: 'chmod a-s /path/bin'."
+                ),
+                references=["https://attack.mitre.org/techniques/T1554/"],
+            ))
+        if stopped and unverified:
+            findings.append(Finding(
+                id=self.id,
+                title="Package integrity check incomplete: scan stopped early",
+                severity="info",
+                description=(
+                    f"Verified {len(digests)} package-owned file(s); {len(unverified)} were not "
+                    "hashed before the scan stopped. SUID/SGID files were hashed first."
+                ),
+                evidence="\n".join(sorted(unverified)[:30]),
+                remediation="Re-run without interruption, or with a larger --budget, for full coverage.",
+                references=[],
+            ))
+        elif not (modified or unowned):
+            findings.append(Finding(
+                id=self.id,
+                title="Privileged binaries match the package database",
+                severity="info",
+                description=f"Verified {len(digests)} package-owned file(s).",
+                remediation=None,
+                references=[],
+            ))
+        yield from findings
@@ -0,0 +1,180 @@
+import os
+from upsift.checks.base import BaseCheck, Finding
+from upsift.perms import write_risk
+
+PROC = "/proc"
+DELETED_SUFFIX = " (deleted)"
+
+
+def _root_processes():
+    """Yield (pid, name) for every process whose effective UID is 0."""
+    for pid in os.listdir(PROC):
+        if not pid.isdigit():
+            continue
+        name = uid = None
+        try:
+            with open(f"{PROC}/{pid}/status", "rb") as f:
+                for line in f:
+                    if line.startswith(b"Name:"):
+                        name = line[5:].strip().decode(errors="replace")
+                    elif line.startswith(b"Uid:"):
+                        uid = line.split()[2]
+                        break
+        except OSError:
+            continue
+        if uid == b"0":
+            yield pid, name
+
+
+def _mapped_files(pid):
+    """{(dev, inode): path} for the file-backed executable mappings of pid."""
+    files = {}
+    with open(f"{PROC}/{pid}/maps", "rb") as f:
+        for line in f:
+            # address perms offset dev inode pathname
+            parts = line.split(None, 5)
+            if len(parts) != 6 or b"x" not in parts[1] or not parts[5].startswith(b"/"):
+                continue
+            major, _, minor = parts[3].partition(b":")
+            try:
+                key = (os.makedev(int(major, 16), int(minor, 16)), int(parts[4]))
+            except ValueError:
+                continue
+            files[key] = os.fsdecode(parts[5].rstrip(b"\n"))
+    return files
+
+
+def _resolve(pid, path, key):
+    """(path to check, resolve) for a file pid sees as `path`, or None if it is gone.
+
+    /proc shows paths relative to our root when they are reachable from it;
+    files in another mount namespace only exist below /proc/<pid>/root. The
+    (dev, inode) from maps picks the right one. overlayfs maps report the
+    backing inode, so a path that merely exists is the fallback.
+    """
+    existing = None
+    for candidate, resolve in ((path, True), (f"{PROC}/{pid}/root{path}", False)):
+        try:
+            st = os.stat(candidate)
+        except OSError:
+            continue
+        if (st.st_dev, st.st_ino) == key:
+            return candidate, resolve
+        existing = (candidate, resolve)
+    return existing
+
+
+class PrivilegedProcessCheck(BaseCheck):
+    id = "privileged_processes"
+    name = "Hijackable files used by root processes"
+    severity = "high"
+    description = (
+        "Inspects processes currently running as root and flags executables, mapped "
+        "shared libraries and working directories that a non-root user could modify "
+        "or replace, which would run attacker code as root on the next exec or restart."
+    )
+
+    def run(self):
+        findings = []
+        # (dev, inode) -> [path, (path to check, resolve) or None, users];
+        # one entry per unique file across all processes
+        code_users = {}
+        cwd_users = {}
+        seen = readable = 0
+
+        def _add(table, pid, key, path, label):
+            if key not in table:
+                table[key] = [path, _resolve(pid, path, key), []]
+            table[key][2].append(label)
+
+        for pid, name in _root_processes():
+            seen += 1
+            label = f"{name}[{pid}]"
+            try:
+                exe = os.readlink(f"{PROC}/{pid}/exe")
+                st = os.stat(f"{PROC}/{pid}/exe")
+            except OSError:
+                continue  # kernel thread, exited, or not permitted
+            readable += 1
+            try:
+                cwd = os.readlink(f"{PROC}/{pid}/cwd")
+                st_cwd = os.stat(f"{PROC}/{pid}/cwd")
+                _add(cwd_users, pid, (st_cwd.st_dev, st_cwd.st_ino), cwd, label)
+            except OSError:
+                pass
+            try:
+                files = _mapped_files(pid)
+            except OSError:
+                files = {}
+            files[(st.st_dev, st.st_ino)] = exe
+            for key, path in files.items():
+                _add(code_users, pid, key, path, label)
+
+        def _risky(table):
+            for path, target, users in sorted(table.values(), key=lambda e: e[0]):
+                if path.endswith(DELETED_SUFFIX) or target is None:
+                    continue
+                risk = write_risk(*target)
+                if risk:
+                    yield path, risk, users
+
+        hijackable = []
+        for path, risk, users in _risky(code_users):
+            shown = ", ".join(users[:5])
+            if len(users) > 5:
+                shown += f" (+{len(users) - 5})"
+            hijackable.append(f"{path} — {risk} — used by {shown}")
+        risky_cwds = [
+            f"{path} — {risk} — cwd of {', '.join(users[:5])}"
+            for path, risk, users in _risky(cwd_users)
+        ]
+
+        if hijackable:
+            findings.append(Finding(
+                id=self.id,
+                title=f"Found {len(hijackable)} root-used executable(s)/libraries modifiable by others",
+                severity="high",
+                description=self.description,
+                evidence="\n".join(hijackable[:50]),
+                items=hijackable,
+                remediation=(
+                    "Make the files and every parent directory owned by root and not writable "
+                    "by group/other ('chown root: <path>; chmod go-w <path>'), then restart "
+                    "the affected services."
+                ),
+                references=[
+                    "https://attack.mitre.org/techniques/T1574/",
+                    "https://man7.org/linux/man-pages/man5/proc.5.html",
+                ],
+            ))
+        if risky_cwds:
+            findings.append(Finding(
+                id=self.id,
+                title=f"Found {len(risky_cwds)} root working directories writable by others",
+                severity="medium",
+                description=self.description,
+                evidence="\n".join(risky_cwds[:50]),
+                items=risky_cwds,
+                remediation=(
+                    "Start privileged services from a root-owned directory "
+                    "(e.g. WorkingDirectory=/)."
+                ),
+                references=["https://attack.mitre.org/techniques/T1574/"],
+            ))
+        if not findings:
+            if seen and not readable:
+                title = "Root process details not readable — run as root for full check"
+            else:
+                title = "No hijackable files used by root processes"
+            findings.append(Finding(
+                id=self.id,
+                title=title,
+                severity="info",
+                description=(
+                    f"Inspected {readable} of {seen} root process(es) and "
+                    f"{len(code_users)} unique executable/library path(s)."
+                ),
+                remediation=None,
+                references=[],
+            ))
+        return findings
@@ -1,35 +1,116 @@
 from upsift.checks.base import BaseCheck, Finding
+from upsift import sshd
+
+WEAK_ALGORITHMS = (
+    "3des-cbc", "aes128-cbc", "aes192-cbc", "aes256-cbc", "blowfish-cbc", "cast128-cbc",
+    "arcfour", "hmac-md5", "hmac-sha1-96", "diffie-hellman-group1-sha1",
+    "diffie-hellman-group-exchange-sha1",
+)
+
+
+def _yes(value):
+    return value.lower() == "yes"
+
+
+def _weak_algorithms(value):
+    # "-list" only removes algorithms from the default set
+    if value.startswith("-"):
+        return False
+    return any(a.lower() in WEAK_ALGORITHMS for a in value.lstrip("+^").split(","))
+
+
+def _too_many_tries(value):
+    return value.isdigit() and int(value) > 6
+
+
+# (keyword, predicate on the effective value, severity, title, remediation)
+RULES = [
+    ("PermitRootLogin", _yes, "high", "Root can log in with a password",
+     "Set 'PermitRootLogin prohibit-password' (or 'no')."),
+    ("PermitEmptyPasswords", _yes, "high", "Empty passwords are accepted",
+     "Set 'PermitEmptyPasswords no'."),
+    ("PasswordAuthentication", _yes, "medium", "Password authentication is enabled",
+     "Set 'PasswordAuthentication no' and use keys."),
+    ("PermitUserEnvironment", lambda v: v.lower() != "no", "medium",
+     "Users can set environment variables for sshd sessions",
+     "Set 'PermitUserEnvironment no'; ~/.ssh/environment can set LD_PRELOAD and friends."),
+    ("Ciphers", _weak_algorithms, "medium", "Weak ciphers are enabled",
+     "Remove CBC and arcfour ciphers from 'Ciphers'."),
+    ("MACs", _weak_algorithms, "medium", "Weak MACs are enabled",
+     "Remove MD5 and truncated SHA1 MACs from 'MACs'."),
+    ("KexAlgorithms", _weak_algorithms, "medium", "Weak key exchange algorithms are enabled",
+     "Remove SHA1 Diffie-Hellman groups from 'KexAlgorithms'."),
+    ("GatewayPorts", lambda v: v.lower() != "no", "low",
+     "Forwarded ports can bind to all interfaces", "Set 'GatewayPorts no'."),
+    ("X11Forwarding", _yes, "low", "X11 forwarding is enabled", "Set 'X11Forwarding no'."),
+    ("MaxAuthTries", _too_many_tries, "low", "More than 6 authentication attempts allowed",
+     "Set 'MaxAuthTries 3' (or up to 6)."),
+]
+
 
 class SSHWeakConfigCheck(BaseCheck):
     id = "ssh_weak_config"
     name = "Weak SSH daemon config"
     severity = "medium"
-    description = "Detects risky SSHD options (PermitRootLogin yes, PasswordAuthentication yes)."
+    description = (
+        "Evaluates the effective SSH daemon configuration, including Included drop-ins "
+        "and Match blocks, against hardening rules (PermitRootLogin, PasswordAuthentication, "
+        "weak algorithms, ...)."
+    )
 
     def run(self):
         findings = []
         try:
-            with open("/etc/ssh/sshd_config", "r", errors="ignore") as f:
-                text = f.read()
-            risky = []
-            for line in text.splitlines():
-                s = line.strip()
-                if not s or s.startswith("#"):
-                    continue
-                if s.lower().startswith("permitrootlogin") and "yes" in s.lower():
-                    risky.append(s)
-                if s.lower().startswith("passwordauthentication") and "yes" in s.lower():
-                    risky.append(s)
-            if risky:
+            config = sshd.load()
+        except FileNotFoundError:
+            return findings  # sshd not installed
+        except OSError as e:
+            findings.append(Finding(
+                id=self.id,
+                title="SSH daemon config not readable — run as root for full check",
+                severity="info",
+                description=str(e),
+                remediation="Re-run Upsift with sudo.",
+                references=[],
+            ))
+            return findings
+
+        for keyword, bad, severity, title, remediation in RULES:
+            evidence = []
+            value = config.get(keyword)
+            if value is not None and bad(value):
+                found = config.directive(keyword)
+                where = found.where if found else "OpenSSH default"
+                evidence.append(f"{keyword} {value} ({where})")
+            for block, found in config.overrides(keyword):
+                if bad(found.value):
+                    evidence.append(
+                        f"{keyword} {found.value} in 'Match {block.criteria}' ({found.where})"
+                    )
+            if evidence:
                 findings.append(Finding(
                     id=self.id,
-                    title="Risky SSHD options found",
-                    severity="medium",
+                    title=title,
+                    severity=severity,
                     description=self.description,
-                    evidence="\n".join(risky),
-                    remediation="Set PermitRootLogin no, PasswordAuthentication no (use keys), and restart sshd.",
-                    references=["https://www.ssh.com/academy/ssh/sshd_config"],
+                    evidence="\n".join(evidence),
+                    remediation=f"{remediation} Check with 'sshd -T' and restart sshd.",
+                    references=[
+                        "https://man.openbsd.org/sshd_config",
+                        "https://www.ssh.com/academy/ssh/sshd_config",
+                    ],
                 ))
-        except Exception:
-            pass
+
+        if not findings:
+            findings.append(Finding(
+                id=self.id,
+                title="SSH daemon configuration passes hardening rules",
+                severity="info",
+                description=(
+                    f"Evaluated {len(RULES)} rules against {len(config.files)} config file(s) "
+                    f"and {len(config.matches)} Match block(s)."
+                ),
+                remediation=None,
+                references=[],
+            ))
         return findings
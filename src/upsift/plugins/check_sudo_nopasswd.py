@@ -45,6 +45,7 @@ class SudoNoPasswdCheck(BaseCheck):
                 severity="high",
                 description=self.description,
                 evidence="\n".join(risky_lines[:50]),
+                items=risky_lines,
                 remediation="Restrict sudo rules; avoid NOPASSWD; scope commands narrowly; use runas and exact paths.",
                 references=["https://www.sudo.ws/man/1.8.31/sudoers.man.html"],
             ))
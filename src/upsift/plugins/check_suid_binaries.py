@@ -1,58 +1,82 @@
-import os
-import subprocess
+import stat
 from upsift.checks.base import BaseCheck, Finding
+from upsift import fsindex
+from upsift.fswalk import Coverage
+from upsift.suiddb import SuidIndex
+
+RATING_SEVERITY = {"critical": "critical", "high": "high", "unknown": "medium"}
+
+# Ratings reported one finding per binary as soon as the walk finds them
+STREAMED_RATINGS = {"critical", "high"}
 
 class SuidBinariesCheck(BaseCheck):
     id = "suid_binaries"
     name = "SUID/SGID binaries"
     severity = "medium"
     description = "Find world-accessible binaries with SUID/SGID that could allow privilege escalation."
+    api_version = 2
 
-    def run(self):
-        findings = []
+    def run(self, ctx):
         # Search for suid/sgid binaries (common technique)
         try:
-            # Limit depth and ignore special filesystems for speed
-            cmd = ["bash", "-lc", "find / -xdev -perm -4000 -o -perm -2000 2>/dev/null"]
-            out = subprocess.check_output(cmd, text=True, timeout=25)
-            binaries = [p for p in out.strip().splitlines() if p]
-            risky = []
-            # Common suspicious ones beyond the typical baseline can be flagged
-            baseline = {
-                "/usr/bin/passwd",
-                "/usr/bin/sudo",
-                "/bin/su",
-                "/usr/bin/chsh",
-                "/usr/bin/chfn",
-                "/usr/bin/newgrp",
-                "/usr/bin/mount",
-                "/usr/bin/umount",
-            }
-            for b in binaries:
-                if b not in baseline:
-                    risky.append(b)
-            if risky:
-                findings.append(
-                    Finding(
-                        id=self.id,
-                        title=f"Found {len(risky)} unusual SUID/SGID binaries",
-                        severity="medium",
-                        description=self.description,
-                        evidence="\n".join(risky[:50]),
-                        remediation="Audit and remove SUID/SGID where unnecessary. Example: chmod a-s /path/bin",
-                        references=[
-                            "https://gtfobins.github.io/",
-                            "https://www.kernel.org/doc/Documentation/sysctl/fs.txt",
-                        ],
-                    )
+            index = SuidIndex.load()
+            unknown = []
+
+            def select(entry):
+                if not (stat.S_ISREG(entry.mode) and entry.mode & (stat.S_ISUID | stat.S_ISGID)):
+                    return None
+                rating, technique = index.classify(entry.path)
+                if rating in STREAMED_RATINGS:
+                    return entry.path, rating, technique
+                if rating == "unknown":
+                    unknown.append(f"{entry.path} [unknown]")
+                return None
+
+            # Local filesystems only, walked once for all walker checks; under --budget
+            # the usual binary dirs go first
+            coverage = Coverage()
+            for path, rating, technique in fsindex.scan(ctx, self.id, select, coverage):
+                yield Finding(
+                    id=self.id,
+                    title=f"SUID/SGID binary with {rating} exploitability: {path}",
+                    severity=RATING_SEVERITY[rating],
+                    description=self.description,
+                    evidence=f"{path} [{rating}: {technique}]" if technique else f"{path} [{rating}]",
+                    remediation="Audit and remove SUID/SGID where unnecessary. Example: chmod a-s /path/bin",
+                    references=[
+                        "https://gtfobins.github.io/",
+                        "https://www.kernel.org/doc/Documentation/sysctl/fs.txt",
+                    ],
                 )
-        except Exception as e:
-            findings.append(
-                Finding(
+            if unknown:
+                unknown.sort()
+                yield Finding(
+                    id=self.id,
+                    title=f"Found {len(unknown)} unusual SUID/SGID binaries",
+                    severity=RATING_SEVERITY["unknown"],
+                    description=self.description,
+                    evidence="\n".join(unknown[:50]),
+                    items=unknown,
+                    remediation="Audit and remove SUID/SGID where unnecessary. Example: chmod a-s /path/bin",
+                    references=[
+                        "https://gtfobins.github.io/",
+                        "https://www.kernel.org/doc/Documentation/sysctl/fs.txt",
+                    ],
+                )
+            if not coverage.complete:
+                yield Finding(
                     id=self.id,
-                    title="SUID/SGID scan failed",
+                    title="SUID/SGID scan incomplete: scan stopped early",
                     severity="info",
-                    description=str(e),
+                    description=coverage.describe(),
+                    evidence="\n".join(coverage.pending[:30]),
+                    remediation="Re-run without interruption, or with a larger --budget, for full coverage.",
+                    references=[],
                 )
+        except Exception as e:
+            yield Finding(
+                id=self.id,
+                title="SUID/SGID scan failed",
+                severity="info",
+                description=str(e),
             )
-        return findings
@@ -1,38 +1,95 @@
-import os, stat, glob
 from upsift.checks.base import BaseCheck, Finding
+from upsift.perms import write_risk
+from upsift.systemd import index_units
+
+
+def _units(units, limit=5):
+    names = sorted(units)
+    shown = ", ".join(names[:limit])
+    if len(names) > limit:
+        shown += f" (+{len(names) - limit})"
+    return shown
+
 
 class SystemdWritableCheck(BaseCheck):
     id = "systemd_writable"
-    name = "Writable systemd service files"
+    name = "Writable systemd units and service executables"
     severity = "high"
-    description = "Writable unit files allow command hijack to escalate privileges on service restart."
+    description = (
+        "Writable unit files, drop-in directories, or the executables and environment "
+        "files that units run allow command hijack to escalate privileges on service restart."
+    )
 
     def run(self):
         findings = []
-        dirs = ["/etc/systemd/system", "/lib/systemd/system", "/usr/lib/systemd/system"]
-        risky = []
-        for d in dirs:
-            if not os.path.isdir(d):
-                continue
-            for root, _, files in os.walk(d):
-                for f in files:
-                    if not f.endswith(".service"):
-                        continue
-                    fp = os.path.join(root, f)
-                    try:
-                        st = os.stat(fp)
-                        if st.st_mode & stat.S_IWOTH:
-                            risky.append(f"World-writable: {fp}")
-                    except Exception:
-                        continue
-        if risky:
+        index = index_units()
+
+        # Unit definitions: directories, unit files, drop-in dirs and drop-in files
+        risky_units = []
+        for d in index.dirs:
+            risk = write_risk(d)
+            if risk:
+                risky_units.append(f"Unit directory {d}: {risk}")
+        for path, unit in sorted(index.dropin_dirs.items()):
+            risk = write_risk(path)
+            if risk:
+                risky_units.append(f"Drop-in dir {path} ({unit}): {risk}")
+        for path, unit in sorted(index.files.items()):
+            risk = write_risk(path)
+            if risk:
+                risky_units.append(f"{path} ({unit}): {risk}")
+
+        # Referenced executables and EnvironmentFile= paths, each evaluated once
+        risky_targets = []
+        for path, units in sorted(index.targets.items()):
+            risk = write_risk(path)
+            if risk:
+                risky_targets.append(f"{path}: {risk} — used by {_units(units)}")
+
+        if risky_units:
+            findings.append(Finding(
+                id=self.id,
+                title=f"Found {len(risky_units)} writable systemd unit file(s) or directories",
+                severity="high",
+                description=self.description,
+                evidence="\n".join(risky_units[:50]),
+                items=risky_units,
+                remediation=(
+                    "Set unit files to 0644 and directories to 0755, owned by root:root. "
+                    "Review drop-ins with 'systemctl cat <unit>'."
+                ),
+                references=[
+                    "https://www.freedesktop.org/software/systemd/man/systemd.unit.html",
+                    "https://attack.mitre.org/techniques/T1543/002/",
+                ],
+            ))
+        if risky_targets:
             findings.append(Finding(
                 id=self.id,
-                title="Writable systemd units detected",
+                title=f"Found {len(risky_targets)} hijackable executable(s)/environment files used by units",
                 severity="high",
                 description=self.description,
-                evidence="\n".join(risky[:50]),
-                remediation="Set permissions to 0644 and owner root:root for service files.",
-                references=["https://www.freedesktop.org/software/systemd/man/systemd.unit.html"],
+                evidence="\n".join(risky_targets[:50]),
+                items=risky_targets,
+                remediation=(
+                    "Make each referenced file and its parent directories owned by root and not "
+                    "writable by group/other, or point the unit at a root-owned copy."
+                ),
+                references=[
+                    "https://www.freedesktop.org/software/systemd/man/systemd.service.html",
+                    "https://attack.mitre.org/techniques/T1574/",
+                ],
+            ))
+        if not findings:
+            findings.append(Finding(
+                id=self.id,
+                title="No writable systemd units or service executables",
+                severity="info",
+                description=(
+                    f"Checked {len(index.units)} unit(s), {len(index.files)} unit/drop-in file(s) "
+                    f"and {len(index.targets)} referenced path(s)."
+                ),
+                remediation=None,
+                references=[],
             ))
         return findings
@@ -1,21 +1,186 @@
+import os
 import pathlib
+import re
+import signal
+import time
+import warnings
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from upsift.checks.base import BaseCheck, Finding
 
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import crypt  # removed in Python 3.13
+except ImportError:
+    crypt = None
+
+# Algorithms considered too weak for compliance regardless of password quality
+WEAK_ALGORITHMS = {"DES", "BSDi-DES", "MD5-crypt", "SHA1-crypt", "Sun-MD5"}
+MIN_SHA_ROUNDS = 5000
+MIN_BCRYPT_COST = 10
+
+DEFAULT_WORDLIST_SECONDS = 300
+WORDS_PER_TASK = 2000
+PROGRESS_INTERVAL = 1.0
+
+_DES_HASH = re.compile(r"^[./0-9A-Za-z]{13}$")
+_ROUNDS = re.compile(r"^\$[56]\$rounds=(\d+)\$")
+
+
+def classify_hash(pw_field: str):
+    """Return (algorithm, weakness or None) for a crypt(3) password field."""
+    if pw_field.startswith(("!", "*")) or pw_field in ("x", "LK", "NP"):
+        return "locked", None
+    if pw_field.startswith("$1$"):
+        return "MD5-crypt", "MD5-crypt is fast to brute-force"
+    if pw_field.startswith(("$2a$", "$2b$", "$2y$")):
+        cost = int(pw_field[4:6]) if pw_field[4:6].isdigit() else 0
+        if cost < MIN_BCRYPT_COST:
+            return "bcrypt", f"bcrypt cost {cost} < {MIN_BCRYPT_COST}"
+        return "bcrypt", None
+    if pw_field.startswith(("$5$", "$6$")):
+        algo = "SHA-256-crypt" if pw_field[1] == "5" else "SHA-512-crypt"
+        m = _ROUNDS.match(pw_field)
+        rounds = int(m.group(1)) if m else 5000
+        if rounds < MIN_SHA_ROUNDS:
+            return algo, f"{algo} with only {rounds} rounds"
+        return algo, None
+    if pw_field.startswith("$y$"):
+        return "yescrypt", None
+    if pw_field.startswith("$gy$"):
+        return "gost-yescrypt", None
+    if pw_field.startswith("$7$"):
+        return "scrypt", None
+    if pw_field.startswith("$sha1$"):
+        return "SHA1-crypt", "SHA1-crypt is deprecated"
+    if pw_field.startswith("$md5"):
+        return "Sun-MD5", "Sun MD5-crypt is deprecated"
+    if pw_field.startswith("_") and len(pw_field) == 20:
+        return "BSDi-DES", "extended DES is trivially brute-forced"
+    if _DES_HASH.match(pw_field):
+        return "DES", "DES crypt truncates passwords to 8 chars and is trivially brute-forced"
+    return "unknown", None
+
+
+def _salt_setting(pw_field: str) -> str:
+    """The salt/parameter prefix that crypt() needs to reproduce this hash."""
+    if pw_field.startswith("$"):
+        return pw_field[: pw_field.rfind("$")]
+    if pw_field.startswith("_"):
+        return pw_field[:9]
+    return pw_field[:2]
+
+
+def _crack_chunk(setting, hashes, words, deadline):
+    """Worker: hash each candidate once for this salt and compare to every target."""
+    hits = []
+    tested = 0
+    for word in words:
+        if time.monotonic() >= deadline:
+            break
+        tested += 1
+        digest = crypt.crypt(word, setting)
+        if digest in hashes:
+            hits.append(digest)
+    return setting, hits, tested
+
+
+def _ignore_sigint():
+    # Ctrl-C is handled by the scan, which stops submitting work; workers just finish
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _read_words(path, chunk_size):
+    """Yield (chunk, bytes read so far) from a wordlist without loading it whole."""
+    with open(path, "rb") as f:
+        chunk = []
+        for line in f:
+            word = line.rstrip(b"\r\n").decode("utf-8", errors="ignore")
+            if word:
+                chunk.append(word)
+            if len(chunk) >= chunk_size:
+                yield chunk, f.tell()
+                chunk = []
+        if chunk:
+            yield chunk, f.tell()
+
 
 class WeakPasswordsCheck(BaseCheck):
     id = "weak_passwords"
-    name = "Accounts with no password"
+    name = "Accounts with no or weak passwords"
     severity = "critical"
     description = (
-        "Detects local user accounts that have no password set. "
-        "These accounts can be switched to without any credentials, "
-        "making them trivial privilege escalation targets."
+        "Detects local user accounts that have no password set, password hashes "
+        "using weak algorithms, and (with --wordlist) passwords found in a local "
+        "wordlist. Such accounts are trivial privilege escalation targets."
     )
+    api_version = 2
+
+    def _audit_wordlist(self, ctx, accounts, wordlist):
+        """Group hashes by salt setting and test the wordlist once per salt in a process pool.
 
-    def run(self):
-        findings = []
+        Returns (cracked usernames, candidates tested, salts, elapsed, finished).
+        """
+        by_setting = defaultdict(dict)  # setting -> {hash: [users]}
+        for user, pw_field in accounts:
+            by_setting[_salt_setting(pw_field)].setdefault(pw_field, []).append(user)
+        limit = float(ctx.options.get("wordlist_time") or DEFAULT_WORDLIST_SECONDS)
+        deadline = time.monotonic() + limit
+        if ctx.deadline is not None:
+            deadline = min(deadline, ctx.deadline)
+        total_bytes = os.path.getsize(wordlist) or 1
+        start = time.monotonic()
+        last_report = start
+        cracked = []
+        tested = submitted = 0
+        read_all = False
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, initializer=_ignore_sigint) as pool:
+            pending = set()
+            for chunk, pos in _read_words(wordlist, WORDS_PER_TASK):
+                # Word-chunk-major order: every salt sees the top of the list first
+                for setting, hashes in by_setting.items():
+                    if hashes:
+                        pending.add(pool.submit(
+                            _crack_chunk, setting, frozenset(hashes), chunk, deadline
+                        ))
+                        submitted += len(chunk)
+                while len(pending) >= workers * 2 or (pending and time.monotonic() >= deadline):
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        setting, hits, n = fut.result()
+                        tested += n
+                        for h in hits:
+                            cracked.extend(by_setting[setting].pop(h, []))
+                if time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                    ctx.report(self.id, pos, total_bytes)
+                    last_report = time.monotonic()
+                if (
+                    not any(by_setting.values()) or ctx.cancel.is_set()
+                    or time.monotonic() >= deadline
+                ):
+                    break
+            else:
+                read_all = True
+            for fut in pending:
+                if ctx.cancel.is_set() and fut.cancel():
+                    continue
+                setting, hits, n = fut.result()
+                tested += n
+                for h in hits:
+                    cracked.extend(by_setting[setting].pop(h, []))
+        ctx.report(self.id, total_bytes, total_bytes)
+        # Workers skip the rest of a chunk at the deadline, so reaching the end of
+        # the file is not enough: every submitted candidate must have been tested.
+        finished = not any(by_setting.values()) or (read_all and tested == submitted)
+        return cracked, tested, len(by_setting), time.monotonic() - start, finished
+
+    def run(self, ctx):
+        found = False
         no_password = []
         shadow_unreadable = False
+        hashed = []  # (username, pw_field) with a real hash
 
         # Check /etc/shadow for empty password fields
         shadow = pathlib.Path("/etc/shadow")
@@ -30,6 +195,8 @@ class WeakPasswordsCheck(BaseCheck):
                     # Empty password field means no password required
                     if pw_field == "" and not username.startswith("#"):
                         no_password.append(username)
+                    elif pw_field:
+                        hashed.append((username, pw_field))
             except PermissionError:
                 shadow_unreadable = True
 
@@ -46,11 +213,14 @@ class WeakPasswordsCheck(BaseCheck):
                     # 'x' means shadow is used, empty means truly no password
                     if pw_field == "" and username not in no_password:
                         no_password.append(username)
+                    elif pw_field not in ("", "x", "*"):
+                        hashed.append((username, pw_field))
             except Exception:
                 pass
 
         if no_password:
-            findings.append(Finding(
+            found = True
+            yield Finding(
                 id=self.id,
                 title=f"Found {len(no_password)} account(s) with no password",
                 severity="critical",
@@ -64,24 +234,105 @@ class WeakPasswordsCheck(BaseCheck):
                     "https://linux.die.net/man/5/shadow",
                     "https://attack.mitre.org/techniques/T1078/",
                 ],
-            ))
-        elif shadow_unreadable:
-            findings.append(Finding(
+            )
+
+        algorithms = Counter()
+        weak = []
+        active = []
+        for username, pw_field in hashed:
+            algo, weakness = classify_hash(pw_field)
+            if algo == "locked":
+                continue
+            algorithms[algo] += 1
+            active.append((username, pw_field))
+            if weakness or algo in WEAK_ALGORITHMS:
+                weak.append(f"{username}: {weakness or algo}")
+
+        if weak:
+            found = True
+            yield Finding(
+                id=self.id,
+                title=f"Found {len(weak)} account(s) with weak password hashes",
+                severity="high",
+                description="Password hashes use algorithms or parameters that are cheap to brute-force.",
+                evidence="\n".join(weak),
+                remediation=(
+                    "Set ENCRYPT_METHOD YESCRYPT (or SHA512) in /etc/login.defs and the pam_unix "
+                    "line, then have affected users change their password: 'sudo passwd -e <user>'."
+                ),
+                references=[
+                    "https://man7.org/linux/man-pages/man5/crypt.5.html",
+                    "https://attack.mitre.org/techniques/T1110/002/",
+                ],
+            )
+
+        wordlist = ctx.options.get("wordlist")
+        if wordlist and active:
+            found = True
+            if crypt is None:
+                yield Finding(
+                    id=self.id,
+                    title="Wordlist audit unavailable",
+                    severity="info",
+                    description="This Python build has no 'crypt' module (removed in Python 3.13).",
+                    remediation="Run Upsift with Python 3.12 or earlier for the wordlist audit.",
+                    references=[],
+                )
+            else:
+                cracked, tested, salts, elapsed, finished = self._audit_wordlist(
+                    ctx, active, wordlist
+                )
+                summary = (
+                    f"Tested {tested} candidate hashes across {salts} salt(s) in {elapsed:.1f}s"
+                    + ("." if finished else "; stopped early before finishing the list.")
+                )
+                if cracked:
+                    yield Finding(
+                        id=self.id,
+                        title=f"Found {len(cracked)} account(s) with passwords from the wordlist",
+                        severity="critical",
+                        description=summary,
+                        evidence="\n".join(sorted(cracked)),
+                        remediation="Force a password change: 'sudo passwd -e <username>'.",
+                        references=["https://attack.mitre.org/techniques/T1110/002/"],
+                    )
+                else:
+                    yield Finding(
+                        id=self.id,
+                        title="No account passwords found in the wordlist",
+                        severity="info",
+                        description=summary,
+                        remediation=None,
+                        references=[],
+                    )
+
+        if not found and shadow_unreadable:
+            yield Finding(
                 id=self.id,
                 title="/etc/shadow not readable — run as root for full check",
                 severity="info",
                 description="Could not read /etc/shadow to check for empty passwords.",
                 remediation="Re-run Upsift with sudo for complete password audit.",
                 references=[],
-            ))
-        else:
-            findings.append(Finding(
+            )
+        elif not found:
+            yield Finding(
                 id=self.id,
                 title="No passwordless accounts detected",
                 severity="info",
                 description="All accounts appear to have passwords set.",
                 remediation=None,
                 references=[],
-            ))
+            )
+
+        if algorithms:
+            yield Finding(
+                id=self.id,
+                title="Password hash algorithms in use",
+                severity="info",
+                description="Distribution of password hash algorithms across unlocked accounts.",
+                evidence="\n".join(f"{a}: {n}" for a, n in algorithms.most_common()),
+                remediation=None,
+                references=[],
+            )
 
-        return findings
@@ -1,7 +1,7 @@
-import os
 import stat
-import subprocess
 from upsift.checks.base import BaseCheck, Finding
+from upsift import fsindex
+from upsift.fswalk import Coverage
 
 # Directories to skip — these are expected to have world-writable files
 SKIP_DIRS = {
@@ -15,6 +15,17 @@ HIGH_VALUE_PATHS = [
 ]
 
 
+def _in_skip_dir(path):
+    return any(path.startswith(d + "/") for d in SKIP_DIRS)
+
+
+def _is_high_value(path):
+    for hp in HIGH_VALUE_PATHS:
+        if path.startswith(hp):
+            return True
+    return False
+
+
 class WorldWritableFilesCheck(BaseCheck):
     id = "world_writable"
     name = "World-writable files"
@@ -25,80 +36,62 @@ class WorldWritableFilesCheck(BaseCheck):
         "escalation, persistence, or tampering with system behaviour."
     )
 
-    def run(self):
-        findings = []
+    api_version = 2
+
+    def run(self, ctx):
         risky = []
         critical_hits = []
 
-        try:
-            result = subprocess.check_output(
-                ["find", "/", "-xdev", "-type", "f", "-perm", "-0002",
-                 "-not", "-path", "/proc/*",
-                 "-not", "-path", "/sys/*",
-                 "-not", "-path", "/dev/*",
-                 "-not", "-path", "/tmp/*",
-                 "-not", "-path", "/var/tmp/*",
-                 "-not", "-path", "/run/*",
-                 ],
-                text=True,
-                timeout=30,
-                stderr=subprocess.DEVNULL,
-            )
-
-            files = [f for f in result.strip().splitlines() if f]
-
-            for f in files:
-                risky.append(f)
-                for hp in HIGH_VALUE_PATHS:
-                    if f.startswith(hp):
-                        critical_hits.append(f)
-                        break
+        def select(entry):
+            if not (stat.S_ISREG(entry.mode) and entry.mode & stat.S_IWOTH):
+                return None
+            if _in_skip_dir(entry.path):
+                return None
+            risky.append(entry.path)
+            return entry.path if _is_high_value(entry.path) else None
 
-        except subprocess.TimeoutExpired:
-            findings.append(Finding(
-                id=self.id,
-                title="World-writable scan timed out",
-                severity="info",
-                description="The filesystem scan took too long. Try running as root with a narrower scope.",
-                remediation="Run manually: find /etc /usr /bin -type f -perm -0002 2>/dev/null",
-                references=[],
-            ))
-            return findings
+        coverage = Coverage()
+        try:
+            # One walk of the local filesystems shared with the other walker checks;
+            # high-value hits are reported as soon as it finds them
+            for path in fsindex.scan(ctx, self.id, select, coverage):
+                critical_hits.append(path)
+                yield Finding(
+                    id=self.id,
+                    title=f"World-writable file in a sensitive location: {path}",
+                    severity="high",
+                    description="Any user can modify this file in a high-value system directory.",
+                    evidence=path,
+                    remediation=(
+                        "Remove world-write permission immediately: "
+                        "'chmod o-w /path/to/file'. Audit file ownership too: 'ls -la /path/to/file'."
+                    ),
+                    references=[
+                        "https://attack.mitre.org/techniques/T1222/",
+                        "https://linux-audit.com/linux-file-permissions-security-hardening/",
+                    ],
+                )
         except Exception as e:
-            findings.append(Finding(
+            yield Finding(
                 id=self.id,
                 title="World-writable scan failed",
                 severity="info",
                 description=str(e),
                 remediation="Run manually: find / -xdev -type f -perm -0002 2>/dev/null",
                 references=[],
-            ))
-            return findings
+            )
+            return
 
-        if critical_hits:
-            findings.append(Finding(
-                id=self.id,
-                title=f"Found {len(critical_hits)} world-writable file(s) in sensitive locations",
-                severity="high",
-                description="World-writable files found in high-value system directories.",
-                evidence="\n".join(critical_hits[:30]),
-                remediation=(
-                    "Remove world-write permission immediately: "
-                    "'chmod o-w /path/to/file'. Audit file ownership too: 'ls -la /path/to/file'."
-                ),
-                references=[
-                    "https://attack.mitre.org/techniques/T1222/",
-                    "https://linux-audit.com/linux-file-permissions-security-hardening/",
-                ],
-            ))
+        risky.sort()
 
         if risky and not critical_hits:
-            findings.append(Finding(
+            yield Finding(
                 id=self.id,
                 title=f"Found {len(risky)} world-writable file(s) outside /tmp",
                 severity="medium",
                 description=self.description,
                 evidence="\n".join(risky[:30]),
+                items=risky,
                 remediation=(
                     "Review each file and remove world-write permission where unnecessary: "
                     "'chmod o-w /path/to/file'."
@@ -106,16 +99,27 @@ class WorldWritableFilesCheck(BaseCheck):
                 references=[
                     "https://attack.mitre.org/techniques/T1222/",
                 ],
-            ))
+            )
 
-        if not risky:
-            findings.append(Finding(
+        if not coverage.complete:
+            yield Finding(
+                id=self.id,
+                title="World-writable scan incomplete: scan stopped early",
+                severity="info",
+                description=(
+                    f"{coverage.describe()} High-value system paths were scanned first; "
+                    "the directories below were not reached."
+                ),
+                evidence="\n".join(coverage.pending[:30]),
+                remediation="Re-run without interruption, or with a larger --budget, for full coverage.",
+                references=[],
+            )
+        elif not risky:
+            yield Finding(
                 id=self.id,
                 title="No world-writable files found outside /tmp",
                 severity="info",
                 description="System looks clean — no unexpected world-writable files detected.",
                 remediation=None,
                 references=[],
-            ))
-
-        return findings
+            )
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+
+BASELINE_MAGIC = b"UPSIFTB1"
+
+# Evidence lines shown per finding; the full list stays in Finding.items
+DISPLAY_ITEMS = 50
+
+
+def load_report(path: str) -> List[dict]:
+    """Load a saved report: a JSON list of findings or NDJSON, one finding per line."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        return json.loads(stripped)
+    records = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            records.append(json.loads(line))
+    return records
+
+
+def normalize_item(text: str) -> str:
+    return " ".join(text.split())
+
+
+def evidence_items(finding: dict) -> List[str]:
+    """A finding's normalized evidence items.
+
+    Uses the untruncated `items` list when the finding carries one, otherwise
+    one item per line of the displayed evidence. Findings without evidence are
+    represented by their title.
+    """
+    raw = finding.get("items")
+    if not raw:
+        raw = (finding.get("evidence") or "").splitlines()
+    items = [normalize_item(line) for line in raw]
+    items = [i for i in items if i]
+    return items or [normalize_item(finding.get("title") or "")]
+
+
+def fingerprint(check_id: str, item: str) -> int:
+    """Stable 64-bit fingerprint of one normalized evidence item."""
+    digest = hashlib.blake2b(f"{check_id}\0{item}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+@dataclass
+class Baseline:
+    fingerprints: Set[int]
+    labels: Dict[int, str] = field(default_factory=dict)  # only known for JSON baselines
+
+
+def save_baseline(path: str, findings: Iterable[dict]) -> int:
+    """Write the compact baseline format: magic + sorted little-endian uint64 fingerprints."""
+    fps = array("Q", sorted({
+        fingerprint(f["id"], item) for f in findings for item in evidence_items(f)
+    }))
+    if sys.byteorder == "big":
+        fps.byteswap()
+    with open(path, "wb") as fh:
+        fh.write(BASELINE_MAGIC)
+        fps.tofile(fh)
+    return len(fps)
+
+
+def load_baseline(path: str) -> Baseline:
+    """Load a compact baseline file, or build one from a saved JSON/NDJSON report."""
+    with open(path, "rb") as fh:
+        head = fh.read(len(BASELINE_MAGIC))
+        if head == BASELINE_MAGIC:
+            fps = array("Q")
+            fps.frombytes(fh.read())
+            if sys.byteorder == "big":
+                fps.byteswap()
+            return Baseline(set(fps))
+    labels = {}
+    for f in load_report(path):
+        for item in evidence_items(f):
+            labels[fingerprint(f["id"], item)] = f"{f['id']}: {item}"
+    return Baseline(set(labels), labels)
+
+
+def diff_against(findings: List[dict], baseline: Baseline) -> Tuple[List[dict], List[str]]:
+    """Reduce findings to evidence items absent from the baseline.
+
+    Returns (new findings, resolved items); resolved items are labelled by
+    check and evidence when the baseline came from a report, else by fingerprint.
+    """
+    current = set()
+    new_findings = []
+    for f in findings:
+        new_lines = []
+        raw = f.get("items") or (f.get("evidence") or "").splitlines()
+        lines = [ln for ln in raw if normalize_item(ln)]
+        for line, item in zip(lines or [None], evidence_items(f)):
+            fp = fingerprint(f["id"], item)
+            current.add(fp)
+            if fp not in baseline.fingerprints:
+                new_lines.append(line)
+        if new_lines:
+            kept = dict(f)
+            if lines:
+                kept["evidence"] = "\n".join(new_lines[:DISPLAY_ITEMS])
+                kept["items"] = new_lines
+            new_findings.append(kept)
+    resolved = [
+        baseline.labels.get(fp, f"{fp:016x}")
+        for fp in sorted(baseline.fingerprints - current)
+    ]
+    return new_findings, resolved
@@ -0,0 +1,192 @@
+import glob
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from . import cache
+
+SSHD_CONFIG = "/etc/ssh/sshd_config"
+CACHE_NAME = "sshd-config"
+
+# Same nesting limit as sshd's readconf
+MAX_INCLUDE_DEPTH = 16
+
+# Upstream OpenSSH defaults for the keywords Upsift evaluates
+DEFAULTS = {
+    "permitrootlogin": "prohibit-password",
+    "passwordauthentication": "yes",
+    "permitemptypasswords": "no",
+    "permituserenvironment": "no",
+    "x11forwarding": "no",
+    "gatewayports": "no",
+    "maxauthtries": "6",
+}
+
+# Older spellings that sshd still accepts
+ALIASES = {
+    "challengeresponseauthentication": "kbdinteractiveauthentication",
+}
+
+
+@dataclass
+class Directive:
+    keyword: str  # lower-cased
+    value: str
+    file: str
+    line: int
+
+    @property
+    def where(self) -> str:
+        return f"{self.file}:{self.line}"
+
+
+@dataclass
+class MatchBlock:
+    criteria: str
+    file: str
+    line: int
+    settings: Dict[str, Directive] = field(default_factory=dict)  # first value wins
+
+
+@dataclass
+class SshdConfig:
+    """Effective sshd configuration: global settings plus Match overrides.
+
+    As in sshd, the first value obtained for a keyword wins, so a drop-in
+    Included at the top of sshd_config overrides later lines in the main file.
+    """
+
+    path: str
+    settings: Dict[str, Directive] = field(default_factory=dict)
+    matches: List[MatchBlock] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+
+    def directive(self, keyword: str) -> Optional[Directive]:
+        return self.settings.get(keyword.lower())
+
+    def get(self, keyword: str) -> Optional[str]:
+        """Global value for `keyword`, falling back to the OpenSSH default."""
+        keyword = keyword.lower()
+        found = self.settings.get(keyword)
+        return found.value if found else DEFAULTS.get(keyword)
+
+    def overrides(self, keyword: str) -> List[Tuple[MatchBlock, Directive]]:
+        """Match blocks that set `keyword` for the connections they match."""
+        keyword = keyword.lower()
+        return [(m, m.settings[keyword]) for m in self.matches if keyword in m.settings]
+
+
+def _split(line: str) -> Optional[Tuple[str, str]]:
+    """Split 'Keyword value' or 'Keyword=value' into (keyword, value)."""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    for i, ch in enumerate(line):
+        if ch.isspace() or ch == "=":
+            keyword, rest = line[:i], line[i:].strip()
+            if rest.startswith("="):
+                rest = rest[1:].strip()
+            return keyword, rest.strip('"')
+    return line, ""
+
+
+class _Parser:
+    def __init__(self, path: str):
+        self.base = os.path.dirname(path) or "."
+        # (block index or -1 for global, keyword, value, file, line)
+        self.directives: List[Tuple[int, str, str, str, int]] = []
+        self.matches: List[Tuple[str, str, int]] = []
+        self.stamps: List[Tuple[str, int]] = []  # files read, for cache validation
+        # Include patterns and what they expanded to, so new or removed files are noticed
+        self.globs: List[Tuple[str, List[str]]] = []
+        self.files: List[str] = []
+
+    def _stamp(self, path: str) -> None:
+        try:
+            self.stamps.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            self.stamps.append((path, -1))
+
+    def read(self, path: str, block: int, depth: int = 0) -> None:
+        with open(path, errors="replace") as f:
+            lines = f.read().splitlines()
+        self._stamp(path)
+        self.files.append(path)
+        for lineno, raw in enumerate(lines, 1):
+            parsed = _split(raw)
+            if parsed is None:
+                continue
+            keyword, value = parsed
+            keyword = keyword.lower()
+            if keyword == "match":
+                # A Match block runs to the next Match or the end of this file
+                self.matches.append((value, path, lineno))
+                block = len(self.matches) - 1
+            elif keyword == "include":
+                if depth >= MAX_INCLUDE_DEPTH:
+                    continue
+                for pattern in value.split():
+                    if not os.path.isabs(pattern):
+                        pattern = os.path.join(self.base, pattern)
+                    expanded = sorted(glob.glob(pattern))
+                    self.globs.append((pattern, expanded))
+                    for inc in expanded:
+                        try:
+                            self.read(inc, block, depth + 1)
+                        except OSError:
+                            continue
+            else:
+                keyword = ALIASES.get(keyword, keyword)
+                self.directives.append((block, keyword, value, path, lineno))
+
+    def raw(self, path: str) -> dict:
+        return {
+            "path": path,
+            "stamps": self.stamps,
+            "globs": self.globs,
+            "files": self.files,
+            "directives": self.directives,
+            "matches": self.matches,
+        }
+
+
+def _build(raw: dict) -> SshdConfig:
+    config = SshdConfig(path=raw["path"], files=list(raw["files"]))
+    config.matches = [MatchBlock(criteria, f, line) for criteria, f, line in raw["matches"]]
+    for block, keyword, value, f, line in raw["directives"]:
+        target = config.settings if block < 0 else config.matches[block].settings
+        target.setdefault(keyword, Directive(keyword, value, f, line))
+    return config
+
+
+def _fresh(raw: dict) -> bool:
+    for path, mtime in raw["stamps"]:
+        try:
+            current = os.stat(path).st_mtime_ns
+        except OSError:
+            current = -1
+        if current != mtime:
+            return False
+    # Re-expanding the patterns also catches wildcards in directory components
+    return all(sorted(glob.glob(pattern)) == list(expanded) for pattern, expanded in raw["globs"])
+
+
+def parse(path: str = SSHD_CONFIG) -> SshdConfig:
+    """Parse `path` and everything it Includes (relative patterns resolve against its directory)."""
+    parser = _Parser(path)
+    parser.read(path, -1)
+    return _build(parser.raw(path))
+
+
+def load(path: str = SSHD_CONFIG) -> SshdConfig:
+    """Like parse(), but reuses the on-disk cache while no involved file or Include match changed."""
+    cached = cache.load(CACHE_NAME)
+    if (
+        isinstance(cached, dict) and cached.get("path") == path and "globs" in cached
+        and _fresh(cached)
+    ):
+        return _build(cached)
+    parser = _Parser(path)
+    parser.read(path, -1)
+    raw = parser.raw(path)
+    cache.store(CACHE_NAME, raw)
+    return _build(raw)
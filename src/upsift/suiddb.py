@@ -0,0 +1,76 @@
+import json
+import os
+import re
+from typing import Dict, Optional, Tuple
+from upsift import cache
+
+DB_PATH = os.path.join(os.path.dirname(__file__), "data", "suid_db.json")
+CACHE_NAME = "suid-index"
+INDEX_VERSION = 2
+
+# python3.11 -> python, perl5.36 -> perl; exploitable names only, never the safe set
+_VERSION_SUFFIX = re.compile(r"[\d.\-]+$")
+
+# A bare safe-list name only counts inside these package-managed trees, so a SUID
+# shell dropped as /tmp/su is not waved through
+SYSTEM_DIRS = ("/bin/", "/sbin/", "/usr/bin/", "/usr/sbin/", "/lib/", "/lib64/", "/usr/lib/",
+               "/usr/lib64/", "/usr/libexec/")
+
+
+def _compile(path: str) -> Dict[str, dict]:
+    with open(path, encoding="utf-8") as f:
+        db = json.load(f)
+    by_path: Dict[str, Tuple[str, str]] = {}
+    safe_names: Dict[str, Tuple[str, str]] = {}
+    by_name: Dict[str, Tuple[str, str]] = {}
+    for entry in db.get("safe", []):
+        (by_path if "/" in entry else safe_names)[entry] = ("safe", "")
+    for name, info in db.get("exploitable", {}).items():
+        by_name[name] = (info["rating"], info.get("technique", ""))
+    return {"path": by_path, "safe_names": safe_names, "name": by_name}
+
+
+class SuidIndex:
+    """Hashed lookup of known-safe and exploitable SUID binaries by full path and basename."""
+
+    def __init__(
+        self,
+        by_path: Dict[str, Tuple[str, str]],
+        safe_names: Dict[str, Tuple[str, str]],
+        by_name: Dict[str, Tuple[str, str]],
+    ):
+        self.by_path = by_path  # safe full paths
+        self.safe_names = safe_names  # safe basenames, trusted only under SYSTEM_DIRS
+        self.by_name = by_name  # exploitable basenames
+
+    @classmethod
+    def load(cls, path: str = DB_PATH) -> "SuidIndex":
+        """Load the bundled database, reusing the precompiled index while the source is unchanged."""
+        st = os.stat(path)
+        key = (INDEX_VERSION, path, st.st_size, st.st_mtime_ns)
+        cached = cache.load(CACHE_NAME)
+        if isinstance(cached, dict) and cached.get("key") == key:
+            return cls(cached["path"], cached["safe_names"], cached["name"])
+        index = _compile(path)
+        cache.store(CACHE_NAME, {"key": key, **index})
+        return cls(index["path"], index["safe_names"], index["name"])
+
+    def _exploitable(self, name: str) -> Optional[Tuple[str, str]]:
+        hit = self.by_name.get(name)
+        if hit is None:
+            stripped = _VERSION_SUFFIX.sub("", name)
+            if stripped and stripped != name:
+                hit = self.by_name.get(stripped)
+        return hit
+
+    def classify(self, path: str) -> Tuple[str, str]:
+        """Return (rating, technique); rating is critical, high, safe or unknown."""
+        hit = self._exploitable(os.path.basename(path))
+        if hit is not None:
+            return hit
+        if path in self.by_path:
+            return self.by_path[path]
+        # Exact basename only: no version-suffix stripping for the safe set
+        if path.startswith(SYSTEM_DIRS) and os.path.basename(path) in self.safe_names:
+            return ("safe", "")
+        return ("unknown", "")
@@ -0,0 +1,195 @@
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Load-path order: the first directory holding a unit name wins, drop-ins from all apply
+UNIT_DIRS = [
+    "/etc/systemd/system",
+    "/run/systemd/system",
+    "/usr/local/lib/systemd/system",
+    "/usr/lib/systemd/system",
+    "/lib/systemd/system",
+]
+
+UNIT_SUFFIXES = (
+    ".service", ".socket", ".timer", ".path", ".mount", ".automount",
+    ".swap", ".target", ".slice", ".scope",
+)
+
+EXEC_KEYS = {
+    "ExecCondition", "ExecStartPre", "ExecStart", "ExecStartPost", "ExecReload",
+    "ExecStop", "ExecStopPost",
+}
+
+# Command-line prefixes that change how systemd runs the command, e.g. "-/bin/true"
+_EXEC_PREFIXES = "@-:+!|"
+
+
+@dataclass
+class UnitIndex:
+    dirs: List[str] = field(default_factory=list)  # unit directories that exist, resolved
+    # unit file or drop-in -> unit, or a glob such as "*.service" for shared drop-ins
+    files: Dict[str, str] = field(default_factory=dict)
+    dropin_dirs: Dict[str, str] = field(default_factory=dict)  # "<name>.d" dir -> unit or glob
+    targets: Dict[str, Set[str]] = field(default_factory=dict)  # referenced path -> units
+    masked: Set[str] = field(default_factory=set)
+
+    @property
+    def units(self) -> Set[str]:
+        return {u for u in self.files.values() if "*" not in u}
+
+
+def parse_unit(path: str) -> Iterator[Tuple[str, str, str]]:
+    """Yield (section, key, value) from a unit file, joining backslash continuations."""
+    section = ""
+    pending = ""
+    with open(path, errors="replace") as f:
+        for raw in f:
+            line = raw.strip()
+            if not pending and (not line or line[0] in "#;"):
+                continue
+            if line.endswith("\\"):
+                pending += line[:-1] + " "
+                continue
+            line, pending = pending + line, ""
+            if line.startswith("[") and line.endswith("]"):
+                section = line[1:-1]
+            elif "=" in line:
+                key, _, value = line.partition("=")
+                yield section, key.strip(), value.strip()
+
+
+def exec_paths(value: str) -> List[str]:
+    """Absolute executables named by an Exec*= value (several if ';'-separated)."""
+    paths = []
+    expect_cmd = True
+    for token in value.split():
+        if token == ";":
+            expect_cmd = True
+            continue
+        if not expect_cmd:
+            continue
+        expect_cmd = False
+        cmd = token.lstrip(_EXEC_PREFIXES).strip("\"'")
+        if cmd.startswith("/") and "%" not in cmd:
+            paths.append(cmd)
+    return paths
+
+
+def _env_path(value: str) -> Optional[str]:
+    path = value.lstrip("-").strip("\"'")
+    if path.startswith("/") and "%" not in path:
+        return path
+    return None
+
+
+def _references(unit_files: Iterable[str]) -> Set[str]:
+    """Executables and environment files referenced by a unit and its drop-ins, in load order."""
+    by_key: Dict[str, List[str]] = {}
+    for path in unit_files:
+        try:
+            entries = list(parse_unit(path))
+        except OSError:
+            continue
+        for _, key, value in entries:
+            if key in EXEC_KEYS:
+                found = exec_paths(value)
+            elif key == "EnvironmentFile":
+                env = _env_path(value)
+                found = [env] if env else []
+            else:
+                continue
+            if not value:
+                by_key[key] = []  # empty assignment resets the list in drop-ins
+            else:
+                by_key.setdefault(key, []).extend(found)
+    return {p for paths in by_key.values() for p in paths}
+
+
+def _is_shared(name: str) -> bool:
+    """True for drop-in names covering several units: "service" or a "foo-.service" prefix."""
+    base, dot, _ = name.rpartition(".")
+    return not dot or (base.endswith("-") and base != "-")
+
+
+def _label(name: str) -> str:
+    """Unit name, or the units a shared drop-in name applies to as a glob."""
+    if not _is_shared(name):
+        return name
+    base, dot, suffix = name.rpartition(".")
+    return f"{base}*.{suffix}" if dot else f"*.{name}"
+
+
+def _dropin_names(unit: str) -> List[str]:
+    """Drop-in directory names (without ".d") applying to `unit`, most specific first.
+
+    "foo-bar.service" reads foo-bar.service.d, then foo-.service.d, then service.d;
+    an instance such as "getty@tty1.service" also reads getty@.service.d.
+    """
+    base, _, suffix = unit.rpartition(".")
+    names = [unit]
+    template, at, _ = base.partition("@")
+    if at:
+        names.append(f"{template}@.{suffix}")
+        base = template
+    parts = base.split("-")
+    for i in range(len(parts) - 1, 0, -1):
+        prefix = "-".join(parts[:i]) + "-." + suffix
+        if prefix not in names:
+            names.append(prefix)
+    return names + [suffix]
+
+
+def index_units(dirs: Iterable[str] = UNIT_DIRS) -> UnitIndex:
+    """Index every unit file and drop-in once, then map referenced paths to units.
+
+    Type-wide (service.d) and prefix (foo-.service.d) drop-ins apply to every
+    matching unit; a conf file in a more specific directory overrides one of
+    the same name in a less specific one.
+    """
+    index = UnitIndex()
+    effective: Dict[str, str] = {}
+    dropins: Dict[str, Dict[str, str]] = {}  # drop-in name -> {conf name: path}, first dir wins
+    for d in dirs:
+        real = os.path.realpath(d)
+        if real in index.dirs or not os.path.isdir(real):
+            continue  # e.g. /lib -> /usr/lib
+        index.dirs.append(real)
+        try:
+            entries = sorted(os.scandir(real), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".d") and entry.is_dir(follow_symlinks=False):
+                unit = name[:-2]
+                index.dropin_dirs[entry.path] = _label(unit)
+                try:
+                    confs = sorted(c for c in os.listdir(entry.path) if c.endswith(".conf"))
+                except OSError:
+                    continue
+                for conf in confs:
+                    dropins.setdefault(unit, {}).setdefault(conf, os.path.join(entry.path, conf))
+            elif name.endswith(UNIT_SUFFIXES) and name not in effective:
+                effective[name] = entry.path
+                if os.path.realpath(entry.path) == os.devnull:
+                    index.masked.add(name)
+
+    for name, confs in dropins.items():
+        if _is_shared(name):
+            for path in confs.values():
+                index.files[path] = _label(name)
+
+    for unit in set(effective) | {n for n in dropins if not _is_shared(n)}:
+        if unit in index.masked:
+            continue
+        confs: Dict[str, str] = {}
+        for name in _dropin_names(unit):
+            for conf, path in dropins.get(name, {}).items():
+                confs.setdefault(conf, path)
+        files = ([effective[unit]] if unit in effective else []) + [confs[c] for c in sorted(confs)]
+        for path in files:
+            index.files.setdefault(path, unit)
+        for target in _references(files):
+            index.targets.setdefault(target, set()).add(unit)
+    return index
@@ -0,0 +1,95 @@
+import struct
+from typing import List, NamedTuple, Optional, Set
+
+CAPABILITY_XATTR = "security.capability"
+ACL_ACCESS_XATTR = "system.posix_acl_access"
+ACL_DEFAULT_XATTR = "system.posix_acl_default"
+
+# Bit positions from linux/capability.h
+CAP_NAMES = [
+    "cap_chown", "cap_dac_override", "cap_dac_read_search", "cap_fowner", "cap_fsetid",
+    "cap_kill", "cap_setgid", "cap_setuid", "cap_setpcap", "cap_linux_immutable",
+    "cap_net_bind_service", "cap_net_broadcast", "cap_net_admin", "cap_net_raw",
+    "cap_ipc_lock", "cap_ipc_owner", "cap_sys_module", "cap_sys_rawio", "cap_sys_chroot",
+    "cap_sys_ptrace", "cap_sys_pacct", "cap_sys_admin", "cap_sys_boot", "cap_sys_nice",
+    "cap_sys_resource", "cap_sys_time", "cap_sys_tty_config", "cap_mknod", "cap_lease",
+    "cap_audit_write", "cap_audit_control", "cap_setfcap", "cap_mac_override",
+    "cap_mac_admin", "cap_syslog", "cap_wake_alarm", "cap_block_suspend", "cap_audit_read",
+    "cap_perfmon", "cap_bpf", "cap_checkpoint_restore",
+]
+
+VFS_CAP_REVISION_MASK = 0xFF000000
+VFS_CAP_FLAGS_EFFECTIVE = 0x000001
+VFS_CAP_REVISION_1 = 0x01000000
+VFS_CAP_REVISION_2 = 0x02000000
+VFS_CAP_REVISION_3 = 0x03000000
+
+ACL_USER_OBJ = 0x01
+ACL_USER = 0x02
+ACL_GROUP_OBJ = 0x04
+ACL_GROUP = 0x08
+ACL_MASK = 0x10
+ACL_OTHER = 0x20
+ACL_UNDEFINED_ID = 0xFFFFFFFF
+
+
+class FileCaps(NamedTuple):
+    permitted: Set[str]
+    inheritable: Set[str]
+    effective: bool
+    rootid: Optional[int]
+
+
+class AclEntry(NamedTuple):
+    tag: int
+    perm: int
+    id: Optional[int]
+
+
+def _cap_set(words) -> Set[str]:
+    names = set()
+    for i, word in enumerate(words):
+        for bit in range(32):
+            if word & (1 << bit):
+                n = i * 32 + bit
+                names.add(CAP_NAMES[n] if n < len(CAP_NAMES) else f"cap_{n}")
+    return names
+
+
+def decode_capability(raw: bytes) -> Optional[FileCaps]:
+    """Decode a vfs_cap_data xattr value (revision 1, 2 or 3)."""
+    if len(raw) < 4:
+        return None
+    (magic,) = struct.unpack_from("<I", raw)
+    revision = magic & VFS_CAP_REVISION_MASK
+    if revision == VFS_CAP_REVISION_1 and len(raw) >= 12:
+        perm, inh = struct.unpack_from("<II", raw, 4)
+        permitted, inheritable, rootid = [perm], [inh], None
+    elif revision in (VFS_CAP_REVISION_2, VFS_CAP_REVISION_3) and len(raw) >= 20:
+        p0, i0, p1, i1 = struct.unpack_from("<IIII", raw, 4)
+        permitted, inheritable = [p0, p1], [i0, i1]
+        rootid = None
+        if revision == VFS_CAP_REVISION_3 and len(raw) >= 24:
+            (rootid,) = struct.unpack_from("<I", raw, 20)
+    else:
+        return None
+    return FileCaps(
+        _cap_set(permitted), _cap_set(inheritable), bool(magic & VFS_CAP_FLAGS_EFFECTIVE), rootid
+    )
+
+
+def decode_acl(raw: bytes) -> List[AclEntry]:
+    """Decode a posix_acl_xattr value into its entries."""
+    if len(raw) < 4 or struct.unpack_from("<I", raw)[0] != 2:
+        return []
+    entries = []
+    for off in range(4, len(raw) - 7, 8):
+        tag, perm, ident = struct.unpack_from("<HHI", raw, off)
+        entries.append(AclEntry(tag, perm, None if ident == ACL_UNDEFINED_ID else ident))
+    return entries
+
+
+def acl_named_writers(entries: List[AclEntry]) -> List[AclEntry]:
+    """Named user/group entries whose write bit survives the ACL mask."""
+    mask = next((e.perm for e in entries if e.tag == ACL_MASK), 7)
+    return [e for e in entries if e.tag in (ACL_USER, ACL_GROUP) and e.perm & mask & 2]
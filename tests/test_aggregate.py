@@ -0,0 +1,52 @@
+import json
+from upsift import aggregate
+
+
+def _write(path, findings, scan_time):
+    with open(path, "w") as f:
+        for rec in findings:
+            f.write(json.dumps(dict(rec, host="web01", scan_time=scan_time)) + "\n")
+
+
+def test_ingest_and_queries(tmp_path):
+    old = [{"id": "suid_binaries", "severity": "medium", "title": "t",
+            "evidence": "/usr/bin/a\n/usr/bin/b"}]
+    new = old + [{"id": "docker_group", "severity": "high", "title": "User in docker group"}]
+    _write(tmp_path / "a.ndjson", old, 100)
+    _write(tmp_path / "b.ndjson", new, 200)
+
+    conn = aggregate.connect(str(tmp_path / "fleet.db"))
+    reports = [str(tmp_path / "a.ndjson"), str(tmp_path / "b.ndjson")]
+    assert aggregate.ingest(conn, reports, jobs=1) == (2, 5, [])
+    # Re-ingesting the same report is a no-op
+    assert aggregate.ingest(conn, [str(tmp_path / "a.ndjson")], jobs=1) == (0, 0, [])
+
+    assert aggregate.hosts_with(conn, "suid_binaries", match="/usr/bin/b") == [("web01", 1)]
+    assert dict((s, n) for s, _, n in aggregate.severity_counts(conn)) == {"medium": 2, "high": 1}
+    assert aggregate.new_since_last(conn) == [
+        ("web01", "docker_group", "high", "User in docker group")
+    ]
+
+
+def test_malformed_report_is_skipped(tmp_path):
+    _write(tmp_path / "good.ndjson", [{"id": "docker_group", "severity": "high", "title": "t"}], 1)
+    (tmp_path / "bad.json").write_text('[{"id": "suid_binaries", "evid')
+    conn = aggregate.connect(str(tmp_path / "fleet.db"))
+    scans, rows, skipped = aggregate.ingest(
+        conn, [str(tmp_path / "good.ndjson"), str(tmp_path / "bad.json")], jobs=1
+    )
+    assert (scans, rows) == (1, 1)
+    assert [p for p, _ in skipped] == [str(tmp_path / "bad.json")]
+
+
+def test_ndjson_records_grouped_by_host(tmp_path):
+    recs = [
+        {"id": "docker_group", "severity": "high", "title": "t", "host": "A", "scan_time": 10},
+        {"id": "suid_binaries", "severity": "medium", "title": "t", "evidence": "/x",
+         "host": "B", "scan_time": 20},
+    ]
+    (tmp_path / "fleet.ndjson").write_text("\n".join(json.dumps(r) for r in recs))
+    conn = aggregate.connect(str(tmp_path / "fleet.db"))
+    assert aggregate.ingest(conn, [str(tmp_path / "fleet.ndjson")], jobs=1)[:2] == (2, 2)
+    assert aggregate.hosts_with(conn, "suid_binaries") == [("B", 1)]
+    assert aggregate.hosts_with(conn, "docker_group") == [("A", 1)]
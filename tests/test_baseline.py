@@ -0,0 +1,48 @@
+import json
+from upsift.report import diff_against, evidence_items, fingerprint, load_baseline, save_baseline
+
+OLD = [
+    {"id": "suid_binaries", "title": "t", "severity": "medium",
+     "evidence": "/usr/bin/a\n/usr/bin/b"},
+    {"id": "docker_group", "title": "User 'x' is in docker group", "severity": "high"},
+]
+NEW = [
+    {"id": "suid_binaries", "title": "t2", "severity": "medium",
+     "evidence": "/usr/bin/a\n/usr/bin/c"},
+]
+
+
+def test_items_are_normalized_before_fingerprinting():
+    assert evidence_items({"evidence": "  x   y \n\n"}) == ["x y"]
+    assert evidence_items({"title": "No  issues", "evidence": None}) == ["No issues"]
+    assert fingerprint("a", "x") != fingerprint("b", "x")
+
+
+def test_compact_and_json_baselines_agree(tmp_path):
+    compact = tmp_path / "base.bin"
+    report = tmp_path / "report.json"
+    assert save_baseline(str(compact), OLD) == 3
+    report.write_text(json.dumps(OLD))
+
+    for path in (compact, report):
+        new, resolved = diff_against(NEW, load_baseline(str(path)))
+        assert [f["evidence"] for f in new] == ["/usr/bin/c"]
+        assert len(resolved) == 2
+    _, resolved = diff_against(NEW, load_baseline(str(report)))
+    assert "suid_binaries: /usr/bin/b" in resolved
+
+
+def test_items_beyond_the_display_cutoff_are_tracked(tmp_path):
+    def finding(paths):
+        return {"id": "world_writable", "title": "t", "severity": "high",
+                "evidence": "\n".join(paths[:50]), "items": paths}
+
+    old = [f"/etc/f{i:03d}" for i in range(80)]
+    base = tmp_path / "base.bin"
+    assert save_baseline(str(base), [finding(old)]) == 80
+
+    # One new item sorts first, one sorts past the cutoff; nothing was resolved
+    current = ["/etc/a-new"] + old + ["/etc/zz-new"]
+    new, resolved = diff_against([finding(current)], load_baseline(str(base)))
+    assert new[0]["items"] == ["/etc/a-new", "/etc/zz-new"]
+    assert resolved == []
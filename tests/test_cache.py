@@ -0,0 +1,47 @@
+import os
+import pytest
+from upsift import cache
+
+
+def test_round_trip(tmp_path, monkeypatch):
+    d = tmp_path / "upsift"
+    monkeypatch.setenv("UPSIFT_CACHE_DIR", str(d))
+    cache.store("digests", {"/bin/true": (1, 2, "md5", "abc")})
+    assert cache.load("digests") == {"/bin/true": (1, 2, "md5", "abc")}
+    assert os.listdir(d) == ["digests"]
+
+
+def test_writable_cache_dir_is_refused(tmp_path, monkeypatch):
+    d = tmp_path / "shared"
+    d.mkdir()
+    monkeypatch.setenv("UPSIFT_CACHE_DIR", str(d))
+    cache.store("digests", {"a": 1})
+    os.chmod(d, 0o777)
+    assert cache.load("digests") is None
+    victim = tmp_path / "victim"
+    victim.write_text("keep")
+    cache.store("digests", {"b": 2})
+    assert victim.read_text() == "keep"
+    assert sorted(os.listdir(d)) == ["digests"]
+
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="needs chown")
+def test_cache_dir_owned_by_another_user_is_refused(tmp_path, monkeypatch):
+    d = tmp_path / "other"
+    d.mkdir(mode=0o700)
+    os.chown(d, 12345, 12345)
+    monkeypatch.setenv("UPSIFT_CACHE_DIR", str(d))
+    cache.store("digests", {"a": 1})
+    assert os.listdir(d) == []
+    assert cache.load("digests") is None
+
+
+def test_symlinked_cache_file_is_not_followed(tmp_path, monkeypatch):
+    d = tmp_path / "upsift"
+    d.mkdir(mode=0o700)
+    monkeypatch.setenv("UPSIFT_CACHE_DIR", str(d))
+    target = tmp_path / "elsewhere"
+    cache.store("x", [1])
+    os.replace(d / "x", target)
+    os.symlink(target, d / "x")
+    assert cache.load("x") is None
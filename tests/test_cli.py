@@ -0,0 +1,23 @@
+from upsift.cli import build_parser
+
+
+def test_scan_options_after_run():
+    args = build_parser().parse_args(
+        ["run", "--timeout", "20", "--budget", "10", "--wordlist", "words.txt",
+         "--baseline", "baseline.bin", "--format", "json"]
+    )
+    assert (args.timeout, args.budget, args.wordlist, args.baseline, args.format) == (
+        20.0, 10.0, "words.txt", "baseline.bin", "json"
+    )
+
+
+def test_scan_options_before_run_are_kept():
+    args = build_parser().parse_args(["--timeout", "20", "--save-baseline", "b.bin", "run"])
+    assert args.timeout == 20.0
+    assert args.save_baseline == "b.bin"
+    assert args.format == "table"
+
+
+def test_aggregate_gets_scan_defaults():
+    args = build_parser().parse_args(["aggregate", "counts"])
+    assert args.timeout is None and args.format == "table"
@@ -0,0 +1,19 @@
+import os
+from upsift.checks.base import CheckContext
+from upsift.overlay import Rootfs
+from upsift.plugins import check_container_rootfs as crf
+
+
+def test_only_unusual_or_exploitable_suid_reported(tmp_path, monkeypatch):
+    monkeypatch.setenv("UPSIFT_CACHE_DIR", str(tmp_path / "cache"))
+    layer = tmp_path / "diff"
+    (layer / "usr/bin").mkdir(parents=True)
+    for name in ("su", "passwd", "find", "helper"):
+        (layer / "usr/bin" / name).write_text("x")
+        os.chmod(layer / "usr/bin" / name, 0o4755)
+    monkeypatch.setattr(crf, "discover_rootfs", lambda: [Rootfs("web", [str(layer)])])
+
+    [finding] = list(crf.ContainerRootfsCheck().run(CheckContext()))
+    assert finding.severity == "high"
+    assert [line.split(" ")[0] for line in finding.items] == ["/usr/bin/find", "/usr/bin/helper"]
+    assert "(SUID, unknown)" in finding.items[1]
@@ -0,0 +1,109 @@
+import time
+import pytest
+from upsift.checks.base import BaseCheck, CheckContext, Finding
+from upsift import engine
+from upsift.engine import CheckTimeout, _run_isolated, _stream_isolated
+
+
+class _Hung(BaseCheck):
+    id = "hung"
+
+    def run(self):
+        time.sleep(60)
+
+
+class _Quick(BaseCheck):
+    id = "quick"
+
+    def run(self):
+        return [Finding(id=self.id, title="ok", severity="info", description="d")]
+
+
+class _Broken(BaseCheck):
+    id = "broken"
+
+    def run(self):
+        raise ValueError("boom")
+
+
+def test_isolated_check_is_killed_on_overrun():
+    start = time.monotonic()
+    with pytest.raises(CheckTimeout):
+        _run_isolated(_Hung(), 0.2)
+    assert time.monotonic() - start < 5
+
+
+def test_isolated_results_and_errors_cross_the_process_boundary():
+    assert [f.title for f in _run_isolated(_Quick(), 5)] == ["ok"]
+    with pytest.raises(RuntimeError, match="boom"):
+        _run_isolated(_Broken(), 5)
+
+
+class _Streaming(BaseCheck):
+    id = "streaming"
+    api_version = 2
+
+    def run(self, ctx):
+        yield Finding(id=self.id, title="first", severity="info", description="d")
+        ctx.report(self.id, 1, 2)
+        while not ctx.should_stop():
+            time.sleep(0.01)
+        yield Finding(id=self.id, title="stopped", severity="info", description="d")
+
+
+def test_partial_results_survive_a_killed_worker():
+    seen = []
+    ctx = CheckContext(progress=lambda *a: seen.append(a))
+    stream = _stream_isolated(_Streaming(), 0.3, ctx)
+    assert next(stream).title == "first"
+    with pytest.raises(CheckTimeout):
+        next(stream)
+    assert seen == [("streaming", 1, 2)]
+
+
+def test_v2_check_stops_when_cancelled():
+    ctx = CheckContext()
+    ctx.cancel.set()
+    assert [f.title for f in _Streaming().iter_findings(ctx)] == ["first", "stopped"]
+
+
+def _walker(check_id):
+    class _Walker(BaseCheck):
+        id = check_id
+        name = check_id
+        api_version = 2
+
+        def run(self, ctx):
+            # Priority paths first, then widen until this check's share runs out
+            yield Finding(id=self.id, title="high-value", severity="high", description="d")
+            while not ctx.should_stop():
+                time.sleep(0.01)
+            yield Finding(id=self.id, title="coverage", severity="info", description="d")
+
+    return _Walker
+
+
+def test_budget_is_shared_between_walkers(monkeypatch):
+    ids = ["walk_a", "walk_b", "walk_c"]
+    monkeypatch.setattr(engine, "_discover_plugins", lambda: [_walker(i) for i in ids])
+    start = time.monotonic()
+    findings = engine.run_checks(budget=1.5)
+    assert time.monotonic() - start < 1.5 + engine.BUDGET_GRACE
+    assert [(f.id, f.title) for f in findings] == [
+        (i, title) for i in ids for title in ("high-value", "coverage")
+    ]
+
+
+class _Producer(BaseCheck):
+    id = "producer"
+    api_version = 2
+
+    def run(self, ctx):
+        ctx.cache["shared"] = ctx.cache.get("shared", 0) + 1
+        yield Finding(id=self.id, title="stored", severity="info", description="d")
+
+
+def test_cache_entries_come_back_from_isolated_workers():
+    ctx = CheckContext()
+    assert [f.title for f in _run_isolated(_Producer(), 5, ctx)] == ["stored"]
+    assert ctx.cache == {"shared": 1}
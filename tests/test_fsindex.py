@@ -0,0 +1,58 @@
+import os
+import stat
+from upsift import fsindex
+from upsift.checks.base import CheckContext
+from upsift.fswalk import Coverage
+
+
+def test_one_walk_shared_between_checks(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    (root / "usr/bin").mkdir(parents=True)
+    (root / "etc").mkdir()
+    for name, mode in (("su", 0o4755), ("ls", 0o755)):
+        (root / "usr/bin" / name).write_text("x")
+        os.chmod(root / "usr/bin" / name, mode)
+    (root / "etc/motd").write_text("x")
+    os.chmod(root / "etc/motd", 0o666)
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text(f"22 1 8:2 / {root} rw - ext4 /dev/sda2 rw\n")
+    monkeypatch.setattr(fsindex, "MOUNTINFO", str(mountinfo))
+
+    ctx = CheckContext()
+    cov = Coverage()
+    suid = list(fsindex.scan(
+        ctx, "suid", lambda e: e.path if e.mode & stat.S_ISUID else None, cov
+    ))
+    assert suid == [str(root / "usr/bin/su")] and cov.complete
+
+    def _no_walk(*args, **kwargs):
+        raise AssertionError("the cached index should have been reused")
+
+    monkeypatch.setattr(fsindex, "stream_local", _no_walk)
+    cov = Coverage()
+    writable = list(fsindex.scan(
+        ctx, "ww", lambda e: e.path if e.mode & stat.S_IWOTH else None, cov
+    ))
+    assert writable == [str(root / "etc/motd")]
+    assert cov.dirs == 4 and cov.mounts == [str(root)]
+
+
+def test_tmpfs_mounts_are_indexed(tmp_path, monkeypatch):
+    root, shm = tmp_path / "root", tmp_path / "shm"
+    root.mkdir()
+    shm.mkdir()
+    (shm / "sh").write_text("x")
+    os.chmod(shm / "sh", 0o4755)
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text(
+        f"22 1 8:2 / {root} rw - ext4 /dev/sda2 rw\n"
+        f"30 22 0:50 / {shm} rw - tmpfs tmpfs rw\n"
+        f"31 22 0:51 / {tmp_path / 'nfs'} rw - nfs4 server:/export rw\n"
+    )
+    monkeypatch.setattr(fsindex, "MOUNTINFO", str(mountinfo))
+    cov = Coverage()
+    hits = list(fsindex.scan(
+        CheckContext(), "suid", lambda e: e.path if e.mode & stat.S_ISUID else None, cov
+    ))
+    assert hits == [str(shm / "sh")]
+    assert cov.mounts == sorted([str(root), str(shm)])
@@ -0,0 +1,43 @@
+import os
+import time
+from upsift import fswalk
+from upsift.fswalk import Coverage, walk
+
+
+def test_priority_roots_first_and_not_revisited(tmp_path):
+    for d in ("a/deep/er", "b", "etc/cron.d"):
+        (tmp_path / d).mkdir(parents=True)
+    cron = str(tmp_path / "etc/cron.d")
+    order = [b.path for b in walk([cron, str(tmp_path)], skip=())]
+    assert order[0] == cron
+    assert order.count(cron) == 1
+    assert len(order) == 7
+
+
+def test_deadline_reports_pending(tmp_path):
+    (tmp_path / "a").mkdir()
+    cov = Coverage()
+    assert list(walk([str(tmp_path)], skip=(), deadline=time.monotonic() - 1, coverage=cov)) == []
+    assert cov.pending == [str(tmp_path)] and not cov.complete
+
+
+def test_stream_local_yields_hits_progress_and_coverage(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    for d in ("etc", "usr/bin", "home/a"):
+        (root / d).mkdir(parents=True)
+    (root / "usr/bin" / "hit").write_text("x")
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text(f"22 1 8:2 / {root} rw - ext4 /dev/sda2 rw\n")
+    monkeypatch.setattr(fswalk, "PROGRESS_INTERVAL", 0)
+
+    def visit(batch):
+        return [os.path.join(batch.path, n) for n, _ in batch.entries if n == "hit"]
+
+    seen = []
+    cov = Coverage()
+    hits = list(fswalk.stream_local(
+        visit, coverage=cov, progress=seen.append, mountinfo=str(mountinfo)
+    ))
+    assert hits == [str(root / "usr/bin/hit")]
+    assert cov.complete and cov.dirs == 6 and cov.mounts == [str(root)]
+    assert seen == list(range(1, 7))
@@ -0,0 +1,27 @@
+from upsift.mounts import parse_mountinfo, select_mounts
+
+MOUNTINFO = """\
+22 1 8:2 / / rw - ext4 /dev/sda2 rw
+23 22 0:21 / /proc rw - proc proc rw
+24 22 8:3 / /home rw - xfs /dev/sda3 rw
+25 22 0:40 / /mnt/nfs rw - nfs4 server:/export rw
+26 22 0:41 / /mnt/sshfs rw - fuse.sshfs user@host: rw
+27 22 0:42 / /run rw - tmpfs tmpfs rw
+28 22 8:3 /srv /var/www rw - xfs /dev/sda3 rw
+29 22 8:17 / /data\\040disk rw - ext4 /dev/sdb1 rw
+"""
+
+
+def test_classify_and_select(tmp_path):
+    path = tmp_path / "mountinfo"
+    path.write_text(MOUNTINFO)
+    mounts = {m.mountpoint: m for m in parse_mountinfo(str(path))}
+    assert mounts["/mnt/nfs"].kind == "network"
+    assert mounts["/mnt/sshfs"].kind == "fuse"
+    assert mounts["/proc"].kind == "pseudo"
+    assert mounts["/run"].kind == "memory"
+    assert mounts["/data disk"].kind == "local"
+
+    selected = [m.mountpoint for m in select_mounts(list(mounts.values()))]
+    # /var/www is a bind mount of a subtree of /home's filesystem
+    assert selected == ["/", "/home", "/data disk"]
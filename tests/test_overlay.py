@@ -0,0 +1,45 @@
+import os
+import time
+from upsift.overlay import LayerCache, compose, discover_rootfs, scan_layer
+
+
+def _layer(root, lid, lowers=()):
+    diff = root / lid / "diff"
+    diff.mkdir(parents=True)
+    (root / "l").mkdir(exist_ok=True)
+    os.symlink(f"../{lid}/diff", root / "l" / lid.upper())
+    if lowers:
+        (root / lid / "lower").write_text(":".join(f"l/{x.upper()}" for x in lowers))
+    return diff
+
+
+def test_shared_layers_scanned_once_and_shadowing(tmp_path):
+    store = tmp_path / "overlay2"
+    base = _layer(store, "base")
+    (base / "usr/bin").mkdir(parents=True)
+    for name in ("su", "gone", "replaced"):
+        (base / "usr/bin" / name).write_text("x")
+        os.chmod(base / "usr/bin" / name, 0o4755)
+    top1 = _layer(store, "c1", lowers=["base"])
+    (top1 / "usr/bin").mkdir(parents=True)
+    (top1 / "usr/bin/.wh.gone").write_text("")
+    (top1 / "usr/bin/replaced").write_text("y")
+    _layer(store, "c2", lowers=["base"])
+
+    rootfs = discover_rootfs([str(store)], mountinfo=str(tmp_path / "none"))
+    assert sorted(r.name for r in rootfs) == ["c1", "c2"]
+
+    cache = LayerCache()
+    visible = {
+        r.name: compose([cache.get(p) for p in r.layers]) for r in rootfs
+    }
+    assert len(cache) == 3
+    assert visible["c1"] == {"usr/bin/su": "suid"}
+    assert set(visible["c2"]) == {"usr/bin/su", "usr/bin/gone", "usr/bin/replaced"}
+
+
+def test_scan_layer_stops_at_deadline(tmp_path):
+    (tmp_path / "usr/bin").mkdir(parents=True)
+    assert scan_layer(str(tmp_path)).complete
+    res = scan_layer(str(tmp_path), deadline=time.monotonic() - 1)
+    assert not res.complete and not res.hits
@@ -0,0 +1,51 @@
+import hashlib
+import os
+from upsift.plugins import check_package_integrity as pi
+
+
+def test_load_dpkg_md5sums(tmp_path, monkeypatch):
+    info = tmp_path / "info"
+    info.mkdir()
+    (info / "coreutils.md5sums").write_text(
+        "d41d8cd98f00b204e9800998ecf8427e  usr/bin/true\n"
+        "0cc175b9c0f1b6a831c399e269772661  usr/share/doc/a b.txt\n"
+    )
+    (info / "libc6:amd64.md5sums").write_text("aaaa  lib/x86_64-linux-gnu/libc.so.6\n")
+    monkeypatch.setattr(pi, "DPKG_MD5SUMS", str(info / "*.md5sums"))
+    owned = {}
+    pi._load_dpkg(pi._RealDirs(), owned)
+    by_pkg = {os.path.basename(p): v for p, v in owned.items()}
+    assert by_pkg["true"] == ("md5", "d41d8cd98f00b204e9800998ecf8427e", "coreutils")
+    assert by_pkg["a b.txt"][2] == "coreutils"
+    assert by_pkg["libc.so.6"] == ("md5", "aaaa", "libc6")
+
+
+def test_hash_file_buffered_and_mmap(tmp_path, monkeypatch):
+    data = os.urandom(3 * pi.CHUNK_SIZE + 17)
+    path = tmp_path / "blob"
+    path.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+    assert pi._hash_file(str(path), "sha256") == expected
+    monkeypatch.setattr(pi, "MMAP_THRESHOLD", 1)
+    assert pi._hash_file(str(path), "sha256") == expected
+
+
+def test_digest_cache_reused_while_key_unchanged(tmp_path, monkeypatch):
+    path = tmp_path / "bin"
+    path.write_bytes(b"payload")
+    candidates = {str(path): os.lstat(path)}
+    owned = {str(path): ("md5", hashlib.md5(b"payload").hexdigest(), "pkg")}
+    first = pi._digests(candidates, owned, {})
+    assert first[str(path)][5] == owned[str(path)][1]
+
+    def _fail(*args):
+        raise AssertionError("cached digest should have been reused")
+
+    monkeypatch.setattr(pi, "_hash_file", _fail)
+    assert pi._digests(candidates, owned, first) == first
+
+    # A changed file (new size/mtime) is hashed again
+    monkeypatch.undo()
+    path.write_bytes(b"trojaned payload")
+    candidates = {str(path): os.lstat(path)}
+    assert pi._digests(candidates, owned, first)[str(path)][5] != owned[str(path)][1]
@@ -0,0 +1,48 @@
+import os
+import pytest
+from upsift import perms
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    perms.clear_cache()
+    yield
+    perms.clear_cache()
+
+
+def test_world_writable_file(tmp_path):
+    path = tmp_path / "lib.so"
+    path.write_text("x")
+    os.chmod(path, 0o666)
+    assert perms.write_risk(str(path)) == f"{path} is world-writable"
+
+
+def test_symlink_in_writable_dir_is_replaceable(tmp_path):
+    open_dir = tmp_path / "open"
+    open_dir.mkdir()
+    os.chmod(open_dir, 0o777)
+    link = open_dir / "sh"
+    os.symlink("/bin/sh", link)
+    assert perms.write_risk(str(link)) == f"{open_dir} is world-writable"
+
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="needs a root-owned tree")
+def test_sticky_dir_and_root_owned_file_are_safe(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    os.chmod(shared, 0o1777)
+    path = shared / "tool"
+    path.write_text("x")
+    os.chmod(path, 0o755)
+    assert perms.write_risk(str(path)) is None
+
+
+def test_results_cached_until_cleared(tmp_path):
+    path = tmp_path / "conf"
+    path.write_text("x")
+    os.chmod(path, 0o644)
+    before = perms.write_risk(str(path))
+    os.chmod(path, 0o666)
+    assert perms.write_risk(str(path)) == before
+    perms.clear_cache()
+    assert perms.write_risk(str(path)) == f"{path} is world-writable"
@@ -0,0 +1,66 @@
+import os
+from upsift import perms
+from upsift.plugins import check_privileged_processes as pp
+
+
+def _maps_line(perm, path):
+    st = os.stat(path)
+    dev = f"{os.major(st.st_dev):02x}:{os.minor(st.st_dev):02x}"
+    return f"7f0000000000-7f0000001000 {perm} 00000000 {dev} {st.st_ino}    {path}\n"
+
+
+def _process(proc, pid, uid, name="svc"):
+    d = proc / str(pid)
+    d.mkdir(parents=True)
+    (d / "status").write_text(
+        f"Name:\t{name}\nUmask:\t0022\nState:\tS (sleeping)\nUid:\t{uid}\t{uid}\t{uid}\t{uid}\n"
+    )
+    return d
+
+
+def test_root_processes_from_status(tmp_path, monkeypatch):
+    proc = tmp_path / "proc"
+    _process(proc, 1, 0, name="init")
+    _process(proc, 42, 1000)
+    (proc / "self").mkdir()
+    monkeypatch.setattr(pp, "PROC", str(proc))
+    assert list(pp._root_processes()) == [("1", "init")]
+
+
+def test_only_executable_mappings_keyed_by_inode(tmp_path, monkeypatch):
+    proc = tmp_path / "proc"
+    d = _process(proc, 7, 0)
+    lib, data = tmp_path / "libx.so", tmp_path / "data.db"
+    lib.write_text("x")
+    data.write_text("x")
+    (d / "maps").write_text(
+        _maps_line("r--p", lib) + _maps_line("r-xp", lib) + _maps_line("rw-s", data)
+        + "7ffd00000000-7ffd00021000 rw-p 00000000 00:00 0    [stack]\n"
+    )
+    monkeypatch.setattr(pp, "PROC", str(proc))
+    st = os.stat(lib)
+    assert pp._mapped_files("7") == {(st.st_dev, st.st_ino): str(lib)}
+
+
+def test_paths_resolved_inside_process_root(tmp_path, monkeypatch):
+    # A containerised root process: its paths only exist below /proc/<pid>/root
+    rootfs = tmp_path / "rootfs"
+    (rootfs / "usr/lib").mkdir(parents=True)
+    lib = rootfs / "usr/lib/libevil.so"
+    lib.write_text("x")
+    os.chmod(lib, 0o666)
+    exe = rootfs / "usr/lib/daemon"
+    exe.write_text("x")
+    proc = tmp_path / "proc"
+    d = _process(proc, 9, 0, name="daemon")
+    os.symlink(rootfs, d / "root")
+    os.symlink(exe, d / "exe")
+    (d / "maps").write_text(_maps_line("r-xp", lib).replace(str(rootfs), ""))
+    monkeypatch.setattr(pp, "PROC", str(proc))
+    perms.clear_cache()
+
+    inside = f"{proc}/9/root/usr/lib/libevil.so"
+    st = os.stat(lib)
+    assert pp._resolve("9", "/usr/lib/libevil.so", (st.st_dev, st.st_ino)) == (inside, False)
+    hijackable = pp.PrivilegedProcessCheck().run()[0]
+    assert f"/usr/lib/libevil.so — {inside} is world-writable — used by daemon[9]" in hijackable.items
@@ -0,0 +1,47 @@
+from upsift import sshd
+from upsift.plugins import check_ssh_weak_config as swc
+
+
+def _run(tmp_path, monkeypatch, text):
+    path = tmp_path / "sshd_config"
+    path.write_text(text)
+    monkeypatch.setattr(sshd, "load", lambda: sshd.parse(str(path)))
+    return {f.title: f for f in swc.SSHWeakConfigCheck().run()}
+
+
+def test_rules_defaults_and_match_overrides(tmp_path, monkeypatch):
+    findings = _run(tmp_path, monkeypatch, (
+        "PermitRootLogin no\n"
+        "Ciphers aes256-ctr,aes128-cbc\n"
+        "MACs -hmac-md5\n"
+        "MaxAuthTries 6\n"
+        "Match Address 10.0.0.0/8\n"
+        "    PermitRootLogin yes\n"
+    ))
+    path = tmp_path / "sshd_config"
+    assert findings["Root can log in with a password"].evidence == (
+        f"PermitRootLogin yes in 'Match Address 10.0.0.0/8' ({path}:6)"
+    )
+    assert findings["Password authentication is enabled"].evidence == (
+        "PasswordAuthentication yes (OpenSSH default)"
+    )
+    assert findings["Weak ciphers are enabled"].evidence == (
+        f"Ciphers aes256-ctr,aes128-cbc ({path}:2)"
+    )
+    assert "Weak MACs are enabled" not in findings
+    assert "More than 6 authentication attempts allowed" not in findings
+    assert "Empty passwords are accepted" not in findings
+
+
+def test_hardened_config_passes(tmp_path, monkeypatch):
+    findings = _run(tmp_path, monkeypatch, "PasswordAuthentication no\n")
+    assert list(findings) == ["SSH daemon configuration passes hardening rules"]
+
+
+def test_unreadable_config(monkeypatch):
+    def _denied():
+        raise PermissionError(13, "Permission denied", "/etc/ssh/sshd_config")
+
+    monkeypatch.setattr(sshd, "load", _denied)
+    [finding] = swc.SSHWeakConfigCheck().run()
+    assert finding.severity == "info" and "not readable" in finding.title
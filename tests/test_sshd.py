@@ -0,0 +1,49 @@
+from upsift import sshd
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_includes_first_match_wins_and_match_blocks(tmp_path):
+    main = tmp_path / "sshd_config"
+    _write(tmp_path / "sshd_config.d" / "10-a.conf", "PasswordAuthentication yes\n")
+    _write(tmp_path / "sshd_config.d" / "20-b.conf", "PasswordAuthentication no\nX11Forwarding=yes\n")
+    _write(main, (
+        "Include sshd_config.d/*.conf\n"
+        "# PermitRootLogin yes\n"
+        "PasswordAuthentication no\n"
+        "PermitRootLogin no\n"
+        "Match User admin\n"
+        "    PermitRootLogin yes\n"
+    ))
+    config = sshd.parse(str(main))
+    assert config.get("PasswordAuthentication") == "yes"
+    assert config.directive("passwordauthentication").file.endswith("10-a.conf")
+    assert config.get("X11Forwarding") == "yes"
+    assert config.get("PermitRootLogin") == "no"
+    assert config.get("PermitEmptyPasswords") == "no"  # default
+    [(block, found)] = config.overrides("PermitRootLogin")
+    assert block.criteria == "User admin" and found.value == "yes"
+    assert len(config.files) == 3
+
+
+def test_cache_invalidated_by_new_dropin(tmp_path, monkeypatch):
+    monkeypatch.setenv("UPSIFT_CACHE_DIR", str(tmp_path / "cache"))
+    main = tmp_path / "sshd_config"
+    _write(main, "Include conf.d/*.conf\nPermitRootLogin no\n")
+    (tmp_path / "conf.d").mkdir()
+    assert sshd.load(str(main)).get("PermitRootLogin") == "no"
+    _write(tmp_path / "conf.d" / "x.conf", "PermitRootLogin yes\n")
+    assert sshd.load(str(main)).get("PermitRootLogin") == "yes"
+
+
+def test_cache_invalidated_by_wildcard_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("UPSIFT_CACHE_DIR", str(tmp_path / "cache"))
+    main = tmp_path / "sshd_config"
+    _write(main, "Include d/*/*.conf\nPermitRootLogin no\n")
+    (tmp_path / "d").mkdir()
+    assert sshd.load(str(main)).get("PermitRootLogin") == "no"
+    _write(tmp_path / "d" / "a" / "x.conf", "PermitRootLogin yes\n")
+    assert sshd.load(str(main)).get("PermitRootLogin") == "yes"
@@ -0,0 +1,31 @@
+from upsift.suiddb import SuidIndex
+
+
+def test_classify_by_name_path_and_version_suffix(tmp_path, monkeypatch):
+    monkeypatch.setenv("UPSIFT_CACHE_DIR", str(tmp_path))
+    index = SuidIndex.load()
+    assert index.classify("/usr/bin/passwd")[0] == "safe"
+    assert index.classify("/usr/bin/python3.11")[0] == "critical"
+    assert index.classify("/opt/tools/base64")[0] == "high"
+    assert index.classify("/opt/vendor/helper") == ("unknown", "")
+    # Second load is served from the precompiled cache
+    assert (tmp_path / "suid-index").exists()
+    assert SuidIndex.load().by_name == index.by_name
+
+
+def test_safe_names_only_trusted_in_system_dirs(tmp_path, monkeypatch):
+    monkeypatch.setenv("UPSIFT_CACHE_DIR", str(tmp_path))
+    index = SuidIndex.load()
+    assert index.classify("/tmp/su") == ("unknown", "")
+    assert index.classify("/home/u/.x/sudo") == ("unknown", "")
+    assert index.classify("/dev/shm/passwd2") == ("unknown", "")
+    assert index.classify("/var/tmp/mount-1") == ("unknown", "")
+    # Version stripping never makes something safe, even in a system dir
+    assert index.classify("/usr/bin/passwd2") == ("unknown", "")
+    assert index.classify("/usr/lib/x86_64-linux-gnu/chrome-sandbox") == ("safe", "")
+
+
+def test_pkexec_is_reported_not_whitelisted(tmp_path, monkeypatch):
+    monkeypatch.setenv("UPSIFT_CACHE_DIR", str(tmp_path))
+    rating, technique = SuidIndex.load().classify("/usr/bin/pkexec")
+    assert rating == "high" and "CVE-2021-4034" in technique
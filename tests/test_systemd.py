@@ -0,0 +1,59 @@
+from upsift.systemd import exec_paths, index_units
+
+
+def test_exec_paths_strips_prefixes():
+    assert exec_paths("-/usr/bin/true --flag") == ["/usr/bin/true"]
+    assert exec_paths("+@/bin/sh sh -c 'x'") == ["/bin/sh"]
+    assert exec_paths("/bin/a ; /bin/b arg") == ["/bin/a", "/bin/b"]
+    assert exec_paths("%h/bin/run") == []
+
+
+def test_index_overrides_dropins_and_masks(tmp_path):
+    etc = tmp_path / "etc"
+    lib = tmp_path / "lib"
+    (etc / "app.service.d").mkdir(parents=True)
+    lib.mkdir()
+    (lib / "app.service").write_text(
+        "[Service]\nExecStart=/opt/app/run \\\n  --daemon\nEnvironmentFile=-/etc/default/app\n"
+    )
+    (lib / "shadowed.service").write_text("[Service]\nExecStart=/lib/old\n")
+    (etc / "shadowed.service").write_text("[Service]\nExecStart=/etc/new\n")
+    (etc / "app.service.d" / "override.conf").write_text(
+        "[Service]\nExecStart=\nExecStart=/opt/app/run2\nExecStartPre=-/opt/app/pre\n"
+    )
+    (etc / "gone.service").symlink_to("/dev/null")
+    (lib / "gone.service").write_text("[Service]\nExecStart=/bin/gone\n")
+
+    index = index_units([str(etc), str(lib)])
+    assert index.masked == {"gone.service"}
+    assert index.targets == {
+        "/opt/app/run2": {"app.service"},
+        "/opt/app/pre": {"app.service"},
+        "/etc/default/app": {"app.service"},
+        "/etc/new": {"shadowed.service"},
+    }
+    assert index.files[str(etc / "app.service.d" / "override.conf")] == "app.service"
+
+
+def test_type_and_prefix_dropins_apply_to_matching_units(tmp_path):
+    etc = tmp_path / "etc"
+    lib = tmp_path / "lib"
+    for d in ("service.d", "foo-.service.d", "foo-bar.service.d"):
+        (etc / d).mkdir(parents=True)
+    lib.mkdir()
+    for unit in ("foo-bar.service", "foo-baz.service", "other.service", "foo-bar.socket"):
+        (lib / unit).write_text("[Unit]\n")
+    (etc / "service.d" / "10-all.conf").write_text("[Service]\nExecStartPre=/opt/all\n")
+    (etc / "foo-.service.d" / "20-foo.conf").write_text("[Service]\nExecStartPost=/opt/foo\n")
+    # Same conf name in a more specific directory overrides the prefix one
+    (etc / "foo-bar.service.d" / "20-foo.conf").write_text("[Service]\nExecStartPost=/opt/bar\n")
+
+    index = index_units([str(etc), str(lib)])
+    assert index.targets == {
+        "/opt/all": {"foo-bar.service", "foo-baz.service", "other.service"},
+        "/opt/foo": {"foo-baz.service"},
+        "/opt/bar": {"foo-bar.service"},
+    }
+    assert index.dropin_dirs[str(etc / "service.d")] == "*.service"
+    assert index.files[str(etc / "foo-.service.d" / "20-foo.conf")] == "foo-*.service"
+    assert index.units == {"foo-bar.service", "foo-baz.service", "other.service", "foo-bar.socket"}
@@ -0,0 +1,37 @@
+import time
+import pytest
+from upsift.plugins.check_weak_passwords import _crack_chunk, _salt_setting, classify_hash
+
+
+@pytest.mark.parametrize("pw_field, expected", [
+    ("abJnggxhB/yWI", ("DES", "DES crypt truncates passwords to 8 chars and is trivially brute-forced")),
+    ("$1$saltsalt$qjXMvbEw8oaL.CzflDugX/", ("MD5-crypt", "MD5-crypt is fast to brute-force")),
+    ("$2b$08$" + "a" * 53, ("bcrypt", "bcrypt cost 8 < 10")),
+    ("$2b$12$" + "a" * 53, ("bcrypt", None)),
+    ("$6$rounds=1000$salt$" + "a" * 86, ("SHA-512-crypt", "SHA-512-crypt with only 1000 rounds")),
+    ("$6$salt$" + "a" * 86, ("SHA-512-crypt", None)),
+    ("$y$j9T$salt$" + "a" * 43, ("yescrypt", None)),
+    ("!$6$salt$" + "a" * 86, ("locked", None)),
+    ("*", ("locked", None)),
+])
+def test_classify_hash(pw_field, expected):
+    assert classify_hash(pw_field) == expected
+
+
+def test_salt_setting():
+    assert _salt_setting("$6$rounds=1000$salt$hash") == "$6$rounds=1000$salt"
+    assert _salt_setting("$y$j9T$salt$hash") == "$y$j9T$salt"
+    assert _salt_setting("_J9..saltHASHHASHHAS") == "_J9..salt"
+    assert _salt_setting("abJnggxhB/yWI") == "ab"
+
+
+def test_crack_chunk():
+    crypt = pytest.importorskip("crypt")
+    target = crypt.crypt("hunter2", "$6$saltsalt")
+    setting, hits, tested = _crack_chunk(
+        "$6$saltsalt", frozenset([target]), ["password", "hunter2", "letmein"],
+        time.monotonic() + 60,
+    )
+    assert (setting, hits, tested) == ("$6$saltsalt", [target], 3)
+    # Nothing is tested once the deadline has passed
+    assert _crack_chunk("$6$saltsalt", frozenset([target]), ["hunter2"], 0)[1:] == ([], 0)
@@ -0,0 +1,30 @@
+import struct
+from upsift.xattrs import (
+    ACL_GROUP_OBJ, ACL_MASK, ACL_OTHER, ACL_USER, ACL_USER_OBJ,
+    acl_named_writers, decode_acl, decode_capability,
+)
+
+
+def test_decode_capability_v2():
+    # cap_net_raw + cap_setuid permitted, effective flag set
+    raw = struct.pack("<IIIII", 0x02000001, (1 << 13) | (1 << 7), 0, 0, 0)
+    caps = decode_capability(raw)
+    assert caps.permitted == {"cap_net_raw", "cap_setuid"}
+    assert caps.effective and caps.rootid is None
+
+
+def test_acl_mask_limits_named_writers():
+    def acl(mask):
+        entries = [(ACL_USER_OBJ, 7, 0xFFFFFFFF), (ACL_USER, 6, 1000),
+                   (ACL_GROUP_OBJ, 5, 0xFFFFFFFF), (ACL_MASK, mask, 0xFFFFFFFF),
+                   (ACL_OTHER, 5, 0xFFFFFFFF)]
+        return struct.pack("<I", 2) + b"".join(struct.pack("<HHI", *e) for e in entries)
+    assert [e.id for e in acl_named_writers(decode_acl(acl(7)))] == [1000]
+    assert acl_named_writers(decode_acl(acl(5))) == []
+
+
+def test_inheritable_only_caps_are_not_granted():
+    from upsift.plugins.check_file_capabilities import _risky_caps
+    # cap_setuid inheritable only, cap_net_raw permitted
+    raw = struct.pack("<IIIII", 0x02000000, 1 << 13, 1 << 7, 0, 0)
+    assert _risky_caps(decode_capability(raw)) == ([], ["cap_setuid"])